@@ -6,12 +6,91 @@ For details, see the LICENSE file in the project root.
 MeteoForecast main class.
 """
 
+import asyncio
 import warnings
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import quote
 
-import pytz
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class _BoundedRetry(Retry):
+    """
+    Retry policy honoring Retry-After header for at most MeteoForecast.retry_after_max seconds.
+    """
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MeteoForecast.retry_after_max)
+
+
+class _TTLCache:
+    """
+    Thread-safe cache keeping the most recently used entries, optionally for a limited time.
+    """
+    __slots__ = ('_entries', '_lock')
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Any) -> Any:
+        """
+        Return cached value and mark it as the most recently used.
+
+        :param key: Cache key
+        :type key: Any
+        :return: Cached value or None if the key is not cached or the entry has expired
+        :rtype: Any
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (entry[0] is not None and entry[0] <= monotonic()):
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Any, value: Any, maxsize: int, ttl: Optional[float] = None):
+        """
+        Store value and evict the least recently used entries above maxsize.
+
+        :param key: Cache key
+        :type key: Any
+        :param value: Value to store, must not be None
+        :type value: Any
+        :param maxsize: Maximum number of kept entries
+        :type maxsize: int
+        :param ttl: Seconds the value is valid for (default: None, never expires)
+        :type ttl: float or None
+        """
+        expires = None if ttl is None else monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove all entries.
+        """
+        with self._lock:
+            self._entries.clear()
 
 
 class MeteoForecast:
@@ -27,11 +106,19 @@ class MeteoForecast:
         sun radiation, and surface pressure)
     For available models, grids, fields, and levels please see https://api.meteo.pl/reference/
 
+    HTTP connections are kept alive in a per-instance session, so the instance can be used as a context manager
+    (or closed with close()) to release them.
+
     :examples:
         >>> from meteo_forecast import MeteoForecast
         meteo = MeteoForecast(api_key='your_api_key', latitude=52.2297, longitude=21.0122)  # Using default config
         forecast = meteo.get_forecast()
     """
+    __slots__ = (
+        'api_key', 'lat', 'lon', 'config', 'main_url', 'x', 'y', '_session',
+        '_response_cache', '_now',
+    )
+
     default_config = {
         'model': 'wrf',
         'grid': 'd02_XLONG_XLAT',
@@ -53,6 +140,20 @@ class MeteoForecast:
     }
     base_url = r'https://api.meteo.pl/api/v1/model/'
     request_timeout = 5  # seconds
+    pool_maxsize = 16  # maximum number of kept-alive connections per session
+    max_workers = 8  # maximum number of fields fetched concurrently
+    max_retries = 3  # number of retries of failed requests (connection errors, 429 and 5xx responses)
+    retry_backoff_factor = 0.3  # seconds, doubled with every retry
+    retry_after_max = 10  # seconds, upper bound of a single wait requested by Retry-After header
+    xy_cache_size = 1024  # maximum number of cached grid coordinates
+    response_cache_ttl = 0  # seconds GET responses are reused by an instance, 0 (default) disables the cache
+    response_cache_size = 256  # maximum number of cached GET responses per instance
+    metadata_cache_ttl = 3600  # seconds available_* results are reused by the process, 0 disables the cache
+    metadata_cache_size = 256  # maximum number of cached available_* results
+    _xy_cache = _TTLCache()
+    _shared_session: Optional[requests.Session] = None  # session of calls made without instance session
+    _shared_session_lock = Lock()
+    _metadata_cache = _TTLCache()
 
     def __init__(
             self,
@@ -60,6 +161,7 @@ class MeteoForecast:
             latitude: Optional[float] = None,
             longitude: Optional[float] = None,
             config: Optional[Dict[str, Any]] = None,
+            now_provider: Optional[Callable[[], datetime]] = None,
     ):
         """
         Initialize MeteoForecast instance.
@@ -73,8 +175,14 @@ class MeteoForecast:
         :type longitude: float or None
         :param config: Optional configuration dictionary (model: str, grid: str, fields: List[Tuple[str, int]])
         :type config: dict or None
+        :param now_provider: Optional function returning current timezone aware date in any timezone
+            (default: current UTC time)
+        :type now_provider: Callable[[], datetime] or None
         """
         self.api_key = api_key
+        self._now = MeteoForecast._utc_now if now_provider is None else now_provider
+        self._session = MeteoForecast._create_session()
+        self._response_cache = _TTLCache()
         if latitude is not None and longitude is not None:
             self.lat = latitude
             self.lon = longitude
@@ -83,13 +191,106 @@ class MeteoForecast:
             self.lon = None
         self.config = self.default_config if config is None else config
         MeteoForecast._check_config(self.config)
-        self.main_url = f'{self.base_url}{self.config["model"]}/grid/{self.config["grid"]}/'
+        self.main_url = MeteoForecast._grid_url(self.config['model'], self.config['grid'])
         self.x = None
         self.y = None
 
         if self.lat is not None and self.lon is not None:
             self._set_xy()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Close the HTTP session and release pooled connections.
+        """
+        self._session.close()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create HTTP session with connection pool for the meteo.pl API.
+
+        Requests failing with connection errors or transient status codes (429, 500, 502, 503, 504) are retried with
+        exponential backoff, honoring Retry-After header up to retry_after_max seconds. After the last retry the
+        response is returned as is. A single request can therefore block for up to about
+        (max_retries + 1) * request_timeout + max_retries * retry_after_max seconds.
+
+        :return: New session
+        :rtype: requests.Session
+        """
+        session = requests.Session()
+        retry = _BoundedRetry(
+            total=MeteoForecast.max_retries,
+            backoff_factor=MeteoForecast.retry_backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(('GET', 'POST')),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=MeteoForecast.pool_maxsize,
+            max_retries=retry,
+        ))
+        return session
+
+    @staticmethod
+    def _utc_now() -> datetime:
+        """
+        Return current UTC date, default now_provider.
+
+        :return: Current timezone aware UTC date
+        :rtype: datetime
+        """
+        return datetime.now(timezone.utc)
+
+    @staticmethod
+    def _get_shared_session() -> requests.Session:
+        """
+        Return session shared by API calls made without an explicit session, creating it on first use.
+
+        :return: Shared session
+        :rtype: requests.Session
+        """
+        with MeteoForecast._shared_session_lock:
+            if MeteoForecast._shared_session is None:
+                MeteoForecast._shared_session = MeteoForecast._create_session()
+            return MeteoForecast._shared_session
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _quote(segment: str) -> str:
+        """
+        Percent-encode URL path segment (model, grid or field name), including "/".
+
+        Results are cached, the same few names are encoded for every API call.
+
+        :param segment: Path segment to encode
+        :type segment: str
+        :return: Encoded path segment
+        :rtype: str
+        """
+        return quote(segment, safe='')
+
+    @staticmethod
+    def _grid_url(model: str, grid: str) -> str:
+        """
+        Build URL of a grid of a model.
+
+        :param model: Model name
+        :type model: str
+        :param grid: Grid name
+        :type grid: str
+        :return: URL ending with "/grid/{grid}/"
+        :rtype: str
+        """
+        return f'{MeteoForecast.base_url}{MeteoForecast._quote(model)}/grid/{MeteoForecast._quote(grid)}/'
+
     @staticmethod
     def _check_config(config: dict):
         """
@@ -116,7 +317,28 @@ class MeteoForecast:
                 raise ValueError('Each field in "fields" must be a tuple of (field_name: str, level: int)')
 
     @staticmethod
-    def _connect_meteo_api_(api_key: str, url: str, post: bool = False) -> dict:
+    @lru_cache(maxsize=16)
+    def _auth_headers(api_key: str) -> dict:
+        """
+        Return authorization headers for an API key.
+
+        Headers are built once per API key and shared between requests, they must not be modified.
+
+        :param api_key: API key for meteo.pl
+        :type api_key: str
+        :return: Headers dictionary
+        :rtype: dict
+        """
+        return {'Authorization': f'Token {api_key}'}
+
+    @staticmethod
+    def _connect_meteo_api_(
+            api_key: str,
+            url: str,
+            post: bool = False,
+            *,
+            session: Optional[requests.Session] = None,
+    ) -> dict:
         """
         Connect to the meteo.pl API and return the response as a dictionary.
 
@@ -126,40 +348,76 @@ class MeteoForecast:
         :type url: str
         :param post: Whether to use POST (default: False, uses GET)
         :type post: bool
-        :return: Response from the API as a dictionary
+        :param session: Session to reuse connections from (default: None, uses session shared by static calls)
+        :type session: requests.Session or None
+        :return: Response from the API as a dictionary (decoded with orjson if it is installed)
         :rtype: dict
         :raises ValueError: If the API response status is not 200
         :raises TypeError: If api_key is not a string
         """
         if not isinstance(api_key, str):
             raise TypeError("api_key must be a string")
-        headers = {'Authorization': f'Token {api_key}'}
+        headers = MeteoForecast._auth_headers(api_key)
+        http = MeteoForecast._get_shared_session() if session is None else session
         if post:
-            response = requests.post(url, headers=headers, timeout=MeteoForecast.request_timeout)
+            response = http.post(url, headers=headers, timeout=MeteoForecast.request_timeout)
         else:
-            response = requests.get(url, headers=headers, timeout=MeteoForecast.request_timeout)
+            response = http.get(url, headers=headers, timeout=MeteoForecast.request_timeout)
         if response.status_code != 200:
             raise ValueError(f"Failed to connect to Meteo API: {response.status_code} - {response.text}")
+        if orjson is not None:
+            return orjson.loads(response.content)  # pylint: disable=no-member
         return response.json()
 
     def _connect_meteo_api(self, url: str, post: bool = False) -> dict:
         """
-        Instance wrapper for connecting to the meteo.pl API using the stored API key.
+        Instance wrapper for connecting to the meteo.pl API using the stored API key and session.
+
+        If response_cache_ttl is set, GET responses are cached per API key and URL for that many seconds (up to
+        response_cache_size most recently used entries), use clear_response_cache() to drop them. Cached responses are
+        shared between calls and must not be modified. POST responses are never cached.
 
         :param url: URL to connect to
         :type url: str
         :param post: Whether to use POST (default: False, uses GET)
         :type post: bool
-        :return: Response from the API as a dictionary
+        :return: Response from the API as a dictionary (read-only if it comes from the response cache)
         :rtype: dict
         """
-        return MeteoForecast._connect_meteo_api_(api_key=self.api_key, url=url, post=post)
+        if post or self.response_cache_ttl <= 0:
+            return MeteoForecast._connect_meteo_api_(api_key=self.api_key, url=url, post=post, session=self._session)
+
+        # API key is a part of the key, so responses fetched with a replaced key are not reused
+        api_key = self.api_key
+        key = (api_key, url)
+        result = self._response_cache.get(key)
+        if result is None:
+            result = MeteoForecast._connect_meteo_api_(api_key=api_key, url=url, session=self._session)
+            self._response_cache.put(key, result, self.response_cache_size, self.response_cache_ttl)
+        return result
+
+    def clear_response_cache(self):
+        """
+        Clear the cache of GET responses used by this instance.
+        """
+        self._response_cache.clear()
 
     @staticmethod
-    def get_xy(api_key: str, latitude: float, longitude: float, model: str, grid: str) -> tuple[int, int]:
+    def get_xy(
+            api_key: str,
+            latitude: float,
+            longitude: float,
+            model: str,
+            grid: str,
+            *,
+            session: Optional[requests.Session] = None,
+    ) -> tuple[int, int]:
         """
         Get grid coordinates (x, y) for a given latitude and longitude.
 
+        Results are cached per process (up to xy_cache_size most recently used entries), use clear_xy_cache() to
+        drop them.
+
         :param api_key: API key for meteo.pl
         :type api_key: str
         :param latitude: Latitude
@@ -170,12 +428,44 @@ class MeteoForecast:
         :type model: str
         :param grid: Grid name
         :type grid: str
+        :param session: Session to reuse connections from (optional)
+        :type session: requests.Session or None
         :return: Tuple of (x, y) grid coordinates
         :rtype: tuple[int, int]
         """
-        url = f'{MeteoForecast.base_url}{model}/grid/{grid}/latlon2rowcol/{latitude}%2C{longitude}/'
-        data = MeteoForecast._connect_meteo_api_(api_key=api_key, url=url)['points']
-        return data[0]['col'], data[0]['row']
+        key = (api_key, latitude, longitude, model, grid)
+        xy = MeteoForecast._xy_cache.get(key)
+        if xy is None:
+            url = f'{MeteoForecast._grid_url(model, grid)}latlon2rowcol/{latitude}%2C{longitude}/'
+            data = MeteoForecast._connect_meteo_api_(api_key=api_key, url=url, session=session)['points']
+            xy = data[0]['col'], data[0]['row']
+            MeteoForecast._xy_cache.put(key, xy, MeteoForecast.xy_cache_size)
+        return xy
+
+    @staticmethod
+    def clear_xy_cache():
+        """
+        Clear the cache of grid coordinates used by get_xy.
+        """
+        MeteoForecast._xy_cache.clear()
+
+    @staticmethod
+    def _fields_url(model: str, grid: str, x: int, y: int) -> str:
+        """
+        Build URL of the fields endpoint for given grid coordinates.
+
+        :param model: Model name
+        :type model: str
+        :param grid: Grid name
+        :type grid: str
+        :param x: Grid column
+        :type x: int
+        :param y: Grid row
+        :type y: int
+        :return: URL ending with "/field/"
+        :rtype: str
+        """
+        return f'{MeteoForecast._grid_url(model, grid)}coordinates/{y}%2C{x}/field/'
 
     def _set_xy(self):
         """
@@ -186,40 +476,90 @@ class MeteoForecast:
             self.lat,
             self.lon,
             model=self.config['model'],
-            grid=self.config['grid']
+            grid=self.config['grid'],
+            session=self._session,
         )
         self.x = x
         self.y = y
 
     @staticmethod
-    def _get_forecast_dates(date: dict) -> list:
+    def _parse_date(value: str) -> datetime:
         """
-        Generate a list of forecast date strings based on the date dictionary from the API.
+        Parse date string in fixed API format "%Y-%m-%dT%H".
 
-        :param date: Dictionary with 'starting-date', 'interval', and 'count'
-        :type date: dict
-        :return: List of date strings in format "%Y-%m-%dT%H"
-        :rtype: list
+        Parsing is done by slicing fixed-width digits which is much faster than datetime.strptime.
+
+        :param value: Date string, e.g. "2024-01-01T06"
+        :type value: str
+        :return: Naive datetime
+        :rtype: datetime
+        :raises ValueError: If the string is not in "%Y-%m-%dT%H" format
         """
-        start_date = datetime.strptime(date['starting-date'], "%Y-%m-%dT%H")
-        interval_hours = date['interval']
-        num_intervals = date['count']
-        dates = [
-            (start_date + timedelta(hours=i * interval_hours)).strftime("%Y-%m-%dT%H")
-            for i in range(num_intervals)
-        ]
-        return dates
+        digits = value[0:4] + value[5:7] + value[8:10] + value[11:13]
+        # int() alone would accept spaces, signs and non-ASCII digits, which strptime rejects
+        if (len(value) != 13 or value[4] != '-' or value[7] != '-' or value[10] != 'T'
+                or not (digits.isascii() and digits.isdigit())):
+            raise ValueError(f"Date '{value}' does not match format '%Y-%m-%dT%H'")
+        return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]), int(value[11:13]))
 
-    def get_forecast(
-            self,
-            latitude: Optional[float] = None,
-            longitude: Optional[float] = None,
-            config: Optional[Dict[str, Any]] = None
-    ) -> dict:
+    @staticmethod
+    def _find_last_forecast_date(dates: list, cutoff: datetime) -> Optional[str]:
         """
-        Fetch the weather forecast for the configured location and fields.
+        Find the latest forecast date of the newest date series which is not older than cutoff.
+
+        :param dates: List of dictionaries with 'starting-date', 'interval', and 'count' from the API
+        :type dates: list
+        :param cutoff: The oldest acceptable forecast date (UTC)
+        :type cutoff: datetime
+        :return: Date string in format "%Y-%m-%dT%H" or None if no date is acceptable
+        :rtype: str or None
+        """
+        # Dates are compared as integer number of hours since 0001-01-01, no timezone handling is needed
+        cutoff_hours = cutoff.toordinal() * 24 + cutoff.hour
+        for date in reversed(dates):
+            if date['count'] < 1:
+                continue
+            # Dates are evenly spaced, so only the last one of the series has to be checked
+            start_date = MeteoForecast._parse_date(date['starting-date'])
+            last_hours = start_date.toordinal() * 24 + start_date.hour + (date['count'] - 1) * date['interval']
+            if last_hours >= cutoff_hours:
+                days, hour = divmod(last_hours, 24)
+                last_date = datetime.fromordinal(days)
+                return f'{last_date.year:04d}-{last_date.month:02d}-{last_date.day:02d}T{hour:02d}'
+        return None
+
+    def _fetch_field(self, field: tuple[str, int], url: str, cutoff: datetime) -> dict:
+        """
+        Fetch the latest forecast for a single field.
 
-        Both latitude and longitude have to be passed to use them instead of already set in constructor.
+        :param field: Tuple of (field name, level)
+        :type field: tuple[str, int]
+        :param url: Field URL of the grid coordinates
+        :type url: str
+        :param cutoff: The oldest acceptable forecast date (UTC)
+        :type cutoff: datetime
+        :return: Forecast response from the API with 'times' and 'data' lists
+        :rtype: dict
+        :raises ValueError: If no valid forecast date is found for the field
+        """
+        field_name, level = field
+        url_date = f'{url}{MeteoForecast._quote(field_name)}/level/{level}/date/'
+        dates = self._connect_meteo_api(url_date)['dates']
+        last_forecast_date = self._find_last_forecast_date(dates, cutoff)
+        if last_forecast_date is None:
+            raise ValueError(f"No valid forecast date found for field {field_name} at level {level}")
+
+        url_forecast = f'{url_date}{last_forecast_date}/forecast/'
+        return self._connect_meteo_api(url_forecast, True)
+
+    def _prepare_forecast(
+            self,
+            latitude: Optional[float],
+            longitude: Optional[float],
+            config: Optional[Dict[str, Any]],
+    ) -> tuple[list, str, datetime]:
+        """
+        Resolve configuration and coordinates for a forecast request.
 
         :param latitude: Latitude for the forecast location (optional, overrides instance latitude)
         :type latitude: float or None
@@ -227,12 +567,10 @@ class MeteoForecast:
         :type longitude: float or None
         :param config: Optional configuration dictionary to override instance config
         :type config: dict or None
-
-        :return: Nested dictionary with forecast data for each time and field
-        :rtype: dict
-
-        :raises ValueError: If no valid forecast date is found for a field
-        :warns: If fetching data for a field fails
+        :return: Tuple of (unique fields in configuration order, field URL of the grid coordinates,
+            the oldest acceptable forecast date)
+        :rtype: tuple[list, str, datetime]
+        :raises ValueError: If coordinates are not set or now_provider returns naive date
         """
         if config is None:
             config = self.config
@@ -243,7 +581,8 @@ class MeteoForecast:
                 latitude=latitude,
                 longitude=longitude,
                 model=config['model'],
-                grid=config['grid']
+                grid=config['grid'],
+                session=self._session,
             )
         else:
             x, y = self.x, self.y
@@ -251,56 +590,170 @@ class MeteoForecast:
         if x is None or y is None:
             raise ValueError("Coordinates must be set before fetching the forecast. Set latitude and longitude in constructor or in get_forecast call.")
 
+        url = MeteoForecast._fields_url(config['model'], config['grid'], x, y)
+        now = self._now()
+        if now.utcoffset() is None:
+            raise ValueError("now_provider must return timezone aware date")
+        # Forecast dates are in UTC, so the cutoff has to be compared in UTC wall-clock time
+        actual_date_minus_24 = now.astimezone(timezone.utc).replace(
+            minute=0,
+            second=0,
+            microsecond=0
+        ) - timedelta(hours=24)
+        # Duplicated (field, level) pairs are fetched only once
+        return list(dict.fromkeys(config['fields'])), url, actual_date_minus_24
+
+    @staticmethod
+    def _merge_forecasts(fields: list, results: list) -> dict:
+        """
+        Merge per-field forecast responses into nested dictionary.
+
+        :param fields: List of tuples with field names and levels
+        :type fields: list
+        :param results: Forecast response or raised exception for each field
+        :type results: list
+        :return: Nested dictionary with forecast data for each time and field
+        :rtype: dict
+        :warns: Single warning listing all fields which failed
+        """
         forecasts = {}
-        url = f'{self.base_url}{config["model"]}/grid/{config["grid"]}/coordinates/{y}%2C{x}/field/'
-        for field in config['fields']:
+        errors = []
+        for (field_name, level), result in zip(fields, results):
+            if isinstance(result, Exception):
+                errors.append(f"field {field_name} at level {level}: {result}")
+                continue
             try:
-                url_field = f'{url}{field[0]}/level/{field[1]}/'
-                url_date = f'{url_field}date/'
-                dates = self._connect_meteo_api(url_date)['dates']
-                actual_date_minus_24 = datetime.now(pytz.UTC).replace(
-                    minute=0,
-                    second=0,
-                    microsecond=0
-                ) - timedelta(hours=24)
-                last_forecast_date = None
-                for date in dates[::-1]:
-                    forecast_dates = self._get_forecast_dates(date)
-                    for forecast_date in forecast_dates[::-1]:
-                        if datetime.strptime(forecast_date, "%Y-%m-%dT%H").replace(tzinfo=pytz.UTC) >= actual_date_minus_24:
-                            last_forecast_date = forecast_date
-                            break
-                    if last_forecast_date is not None:
-                        break
-                if last_forecast_date is None:
-                    raise ValueError(f"No valid forecast date found for field {field[0]} at level {field[1]}")
-
-                url_forecast = f'{url_field}date/{last_forecast_date}/forecast/'
-                forecast_data = self._connect_meteo_api(url_forecast, True)
-                for time, data in zip(forecast_data['times'], forecast_data['data']):
-                    if time not in forecasts:
-                        forecasts[time] = {}
-                    if field[0] not in forecasts[time]:
-                        forecasts[time][field[0]] = {}
-                    forecasts[time][field[0]][field[1]] = data
+                for time, data in zip(result['times'], result['data']):
+                    forecasts.setdefault(time, {}).setdefault(field_name, {})[level] = data
             except Exception as e:  # pylint: disable=broad-exception-caught
-                warnings.warn(f"Failed to fetch data for field {field[0]} at level {field[1]}: {e}")
+                errors.append(f"field {field_name} at level {level}: {e}")
+        if errors:
+            warnings.warn(f"Failed to fetch data for {'; '.join(errors)}")
         return forecasts
 
+    def get_forecast(
+            self,
+            latitude: Optional[float] = None,
+            longitude: Optional[float] = None,
+            config: Optional[Dict[str, Any]] = None
+    ) -> dict:
+        """
+        Fetch the weather forecast for the configured location and fields.
+
+        Both latitude and longitude have to be passed to use them instead of already set in constructor.
+        Fields are fetched concurrently (up to max_workers at once).
+
+        :param latitude: Latitude for the forecast location (optional, overrides instance latitude)
+        :type latitude: float or None
+        :param longitude: Longitude for the forecast location (optional, overrides instance longitude)
+        :type longitude: float or None
+        :param config: Optional configuration dictionary to override instance config
+        :type config: dict or None
+
+        :return: Nested dictionary with forecast data for each time and field
+        :rtype: dict
+
+        :raises ValueError: If no valid forecast date is found for a field
+        :warns: Single warning listing all fields which failed to fetch
+        """
+        fields, url, cutoff = self._prepare_forecast(latitude, longitude, config)
+        with ThreadPoolExecutor(max_workers=min(len(fields), self.max_workers)) as executor:
+            futures = [executor.submit(self._fetch_field, field, url, cutoff) for field in fields]
+        results = [future.exception() or future.result() for future in futures]
+        return self._merge_forecasts(fields, results)
+
+    async def get_forecast_async(
+            self,
+            latitude: Optional[float] = None,
+            longitude: Optional[float] = None,
+            config: Optional[Dict[str, Any]] = None
+    ) -> dict:
+        """
+        Asynchronous version of get_forecast for use inside a running event loop.
+
+        Blocking HTTP requests are run in worker threads (up to max_workers at once), so the event loop is not
+        blocked while waiting for the API.
+
+        :param latitude: Latitude for the forecast location (optional, overrides instance latitude)
+        :type latitude: float or None
+        :param longitude: Longitude for the forecast location (optional, overrides instance longitude)
+        :type longitude: float or None
+        :param config: Optional configuration dictionary to override instance config
+        :type config: dict or None
+
+        :return: Nested dictionary with forecast data for each time and field
+        :rtype: dict
+
+        :raises ValueError: If no valid forecast date is found for a field
+        :warns: Single warning listing all fields which failed to fetch
+        """
+        loop = asyncio.get_running_loop()
+        fields, url, cutoff = await asyncio.to_thread(self._prepare_forecast, latitude, longitude, config)
+        executor = ThreadPoolExecutor(max_workers=min(len(fields), self.max_workers))
+        try:
+            results = await asyncio.gather(
+                *(loop.run_in_executor(executor, self._fetch_field, field, url, cutoff) for field in fields),
+                return_exceptions=True,
+            )
+        finally:
+            # Waiting for running requests would block the event loop when the task is cancelled
+            executor.shutdown(wait=False, cancel_futures=True)
+        return self._merge_forecasts(fields, results)
+
     @staticmethod
-    def available_models(api_key: str) -> list:
+    def _get_metadata(api_key: str, url: str, key: str, *, session: Optional[requests.Session] = None) -> list:
+        """
+        Get a list from a metadata endpoint of the API (models, grids, fields or levels).
+
+        Lists are cached per process for metadata_cache_ttl seconds (up to metadata_cache_size most recently used
+        entries), use clear_metadata_cache() to drop them.
+
+        :param api_key: API key for meteo.pl
+        :type api_key: str
+        :param url: URL to connect to
+        :type url: str
+        :param key: Key of the list in the API response
+        :type key: str
+        :param session: Session to reuse connections from (optional)
+        :type session: requests.Session or None
+        :return: Copy of the list from the API response
+        :rtype: list
+        """
+        cache_key = (api_key, url)
+        result = MeteoForecast._metadata_cache.get(cache_key)
+        if result is None:
+            result = MeteoForecast._connect_meteo_api_(api_key, url, session=session)[key]
+            if MeteoForecast.metadata_cache_ttl <= 0:
+                return result
+            MeteoForecast._metadata_cache.put(
+                cache_key, result, MeteoForecast.metadata_cache_size, MeteoForecast.metadata_cache_ttl
+            )
+        return list(result)
+
+    @staticmethod
+    def clear_metadata_cache():
+        """
+        Clear the cache of lists returned by available_models, available_grids, available_fields and
+        available_levels.
+        """
+        MeteoForecast._metadata_cache.clear()
+
+    @staticmethod
+    def available_models(api_key: str, *, session: Optional[requests.Session] = None) -> list:
         """
         Get a list of available models from the API.
 
         :param api_key: API key for meteo.pl
         :type api_key: str
+        :param session: Session to reuse connections from (optional)
+        :type session: requests.Session or None
         :return: List of available model names
         :rtype: list
         """
-        return MeteoForecast._connect_meteo_api_(api_key, MeteoForecast.base_url)['models']
+        return MeteoForecast._get_metadata(api_key, MeteoForecast.base_url, 'models', session=session)
 
     @staticmethod
-    def available_grids(api_key: str, model: str) -> list:
+    def available_grids(api_key: str, model: str, *, session: Optional[requests.Session] = None) -> list:
         """
         Get a list of available grids for a given model from the API.
 
@@ -308,14 +761,24 @@ class MeteoForecast:
         :type api_key: str
         :param model: Model name
         :type model: str
+        :param session: Session to reuse connections from (optional)
+        :type session: requests.Session or None
         :return: List of available grid names
         :rtype: list
         """
-        url = f'{MeteoForecast.base_url}{model}/grid/'
-        return MeteoForecast._connect_meteo_api_(api_key, url)['grids']
+        url = f'{MeteoForecast.base_url}{MeteoForecast._quote(model)}/grid/'
+        return MeteoForecast._get_metadata(api_key, url, 'grids', session=session)
 
     @staticmethod
-    def available_fields(api_key: str, model: str, grid: str, latitude: float, longitude: float) -> list:
+    def available_fields(
+            api_key: str,
+            model: str,
+            grid: str,
+            latitude: float,
+            longitude: float,
+            *,
+            session: Optional[requests.Session] = None,
+    ) -> list:
         """
         Get a list of available fields for a given model, grid, and location from the API.
 
@@ -329,15 +792,26 @@ class MeteoForecast:
         :type latitude: float
         :param longitude: Longitude
         :type longitude: float
+        :param session: Session to reuse connections from (optional)
+        :type session: requests.Session or None
         :return: List of available field names
         :rtype: list
         """
-        x, y = MeteoForecast.get_xy(api_key, latitude, longitude, model, grid)
-        url = f'{MeteoForecast.base_url}{model}/grid/{grid}/coordinates/{y}%2C{x}/field/'
-        return MeteoForecast._connect_meteo_api_(api_key, url)['fields']
+        x, y = MeteoForecast.get_xy(api_key, latitude, longitude, model, grid, session=session)
+        url = MeteoForecast._fields_url(model, grid, x, y)
+        return MeteoForecast._get_metadata(api_key, url, 'fields', session=session)
 
     @staticmethod
-    def available_levels(api_key: str, model: str, grid: str, field: str, latitude: float, longitude: float) -> list:
+    def available_levels(
+            api_key: str,
+            model: str,
+            grid: str,
+            field: str,
+            latitude: float,
+            longitude: float,
+            *,
+            session: Optional[requests.Session] = None,
+    ) -> list:
         """
         Get a list of available levels for a given field, model, grid, and location from the API.
 
@@ -353,9 +827,11 @@ class MeteoForecast:
         :type latitude: float
         :param longitude: Longitude
         :type longitude: float
+        :param session: Session to reuse connections from (optional)
+        :type session: requests.Session or None
         :return: List of available levels
         :rtype: list
         """
-        x, y = MeteoForecast.get_xy(api_key, latitude, longitude, model, grid)
-        url = f'{MeteoForecast.base_url}{model}/grid/{grid}/coordinates/{y}%2C{x}/field/{field}/level/'
-        return MeteoForecast._connect_meteo_api_(api_key, url)['levels']
+        x, y = MeteoForecast.get_xy(api_key, latitude, longitude, model, grid, session=session)
+        url = f'{MeteoForecast._fields_url(model, grid, x, y)}{MeteoForecast._quote(field)}/level/'
+        return MeteoForecast._get_metadata(api_key, url, 'levels', session=session)
@@ -6,18 +6,67 @@ For details, see the LICENSE file in the project root.
 BaseTest class for MeteoForecast class.
 """
 
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from meteo_forecast.meteo_forecast import MeteoForecast
 
 # pylint: disable=too-few-public-methods
 
+
+def make_forecast(
+        api_key: str,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        config: Optional[Dict[str, Any]] = None,
+        *,
+        x: Optional[int] = 100,
+        y: Optional[int] = 200,
+        now_provider: Optional[Callable[[], datetime]] = None,
+) -> MeteoForecast:
+    """
+    Return MeteoForecast instance with grid coordinates set without calling the API.
+
+    :param api_key: API key for meteo.pl
+    :type api_key: str
+    :param latitude: Latitude for the forecast location
+    :type latitude: float or None
+    :param longitude: Longitude for the forecast location
+    :type longitude: float or None
+    :param config: Configuration dictionary, default configuration if None
+    :type config: dict or None
+    :param x: Grid column
+    :type x: int or None
+    :param y: Grid row
+    :type y: int or None
+    :param now_provider: Function returning current date, current UTC time if None
+    :type now_provider: Callable[[], datetime] or None
+
+    :return: MeteoForecast instance
+    :rtype: MeteoForecast
+    """
+    # Coordinates are set after construction, so __init__ does not resolve them with the API
+    forecast = MeteoForecast(api_key, config=config, now_provider=now_provider)
+    forecast.lat = latitude
+    forecast.lon = longitude
+    forecast.x = x
+    forecast.y = y
+    return forecast
+
+
 class BaseTest:
     """Base test class to support common code"""
 
+    api_key = "test_api_key"  # API key passed to MeteoForecast in tests
+    latitude = 52.2297  # Test location latitude
+    longitude = 21.0122  # Test location longitude
+
     def setup_method(self):
         """Set up test fixtures before each test method."""
+        MeteoForecast.clear_xy_cache()
+        MeteoForecast.clear_metadata_cache()
+        # Mutable fixtures are created per test
         # pylint: disable=attribute-defined-outside-init
-        self.api_key = "test_api_key"
-        self.latitude = 52.2297
-        self.longitude = 21.0122
         self.test_config = {
             'model': 'wrf',
             'grid': 'd01_XLONG_XLAT',
@@ -0,0 +1,36 @@
+"""
+Copyright (c) 2025 Piotr Gawron (dev@gawron.biz)
+This file is licensed under the MIT License.
+For details, see the LICENSE file in the project root.
+
+Shared pytest fixtures for MeteoForecast tests.
+"""
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from meteo_forecast.meteo_forecast import MeteoForecast
+from tests.mocks import get_mock_get_response, get_mock_post_response
+
+
+@pytest.fixture(autouse=True)
+def block_network(monkeypatch):
+    """Fail any test which lets a request reach the transport adapter instead of a mock."""
+    def send(adapter, request, *args, **kwargs):  # pylint: disable=unused-argument
+        pytest.fail(f'Unexpected network call: {request.method} {request.url}')
+    monkeypatch.setattr(HTTPAdapter, 'send', send)
+
+
+@pytest.fixture
+def no_set_xy(monkeypatch):
+    """Skip resolving grid coordinates in MeteoForecast constructor."""
+    monkeypatch.setattr(MeteoForecast, '_set_xy', lambda self: None)
+
+
+@pytest.fixture
+def meteo_api(monkeypatch):
+    """Route requests.Session GET and POST calls to prebuilt meteo.pl API response mocks."""
+    # staticmethod keeps the session instance out of the mock functions' arguments
+    monkeypatch.setattr(requests.Session, 'get', staticmethod(get_mock_get_response()))
+    monkeypatch.setattr(requests.Session, 'post', staticmethod(get_mock_post_response()))
@@ -7,28 +7,34 @@ Mocks for MeteoForecast class tests.
 """
 
 
-import re
-from datetime import datetime, timedelta
-from typing import Callable
+import functools
+import json
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Callable, Optional
 from unittest.mock import Mock
 
-import pytz
+import requests
 
 
+@functools.lru_cache(maxsize=1)
 def get_times_nad_vals() -> dict:
     """
     Return dictionary with times and values for testing.
 
+    The dictionary is built once and shared, it must not be modified.
+
     :return: Dictionary with times and values
     :type: dict
     """
-    now = datetime.now(pytz.UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    now = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    time_format = '%Y-%m-%dT%H:%M:%SZ'
 
     return {
         'times': [
-            now + timedelta(hours=6),
-            now + timedelta(hours=12),
-            now + timedelta(hours=18),
+            (now + timedelta(hours=6)).strftime(time_format),
+            (now + timedelta(hours=12)).strftime(time_format),
+            (now + timedelta(hours=18)).strftime(time_format),
         ],
         'vals': {
             'TSK': [25.0, 24.5, 25.2],
@@ -45,78 +51,177 @@ def get_times_nad_vals() -> dict:
     }
 
 
+# Fixed current date passed as now_provider to MeteoForecast instances
+FROZEN_NOW = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+# Read-only configurations shared by tests, MeteoForecast only reads them
+T2_CONFIG = MappingProxyType({
+    'model': 'wrf',
+    'grid': 'd02_XLONG_XLAT',
+    'fields': [('T2', 0)]
+})
+T2_RAINNC_CONFIG = MappingProxyType({
+    'model': 'wrf',
+    'grid': 'd02_XLONG_XLAT',
+    'fields': [('T2', 0), ('RAINNC', 0)]
+})
+FOUR_FIELDS_CONFIG = MappingProxyType({
+    'model': 'wrf',
+    'grid': 'd02_XLONG_XLAT',
+    'fields': [
+        ('T2', 0),  # Temperature
+        ('RAINNC', 0),  # Rain
+        ('U10', 0),  # Wind U
+        ('PSFC', 0)  # Pressure
+    ]
+})
+# Forecast times and values computed once per test session
+TIMES_AND_VALS = get_times_nad_vals()
+
+
+class FakeResponse:  # pylint: disable=too-few-public-methods
+    """Lightweight stand-in for a successful requests.Response with fixed JSON payload, used by shared mocks."""
+
+    __slots__ = ('status_code', 'text', 'content', '_payload')
+
+    def __init__(self, payload: dict):
+        """
+        Initialize response.
+
+        :param payload: JSON payload of the response
+        :type payload: dict
+        """
+        self.status_code = 200
+        self.text = ''
+        self.content = json.dumps(payload).encode()
+        self._payload = payload
+
+    def json(self) -> dict:
+        """
+        Return JSON payload of the response.
+
+        :return: JSON payload
+        :rtype: dict
+        """
+        return self._payload
+
+
+def get_mock_response(payload: Optional[dict] = None, status_code: int = 200, text: str = '') -> Mock:
+    """
+    Return HTTP response mock with JSON payload.
+
+    All attributes are set when the mock is constructed.
+
+    :param payload: JSON payload of the response
+    :type payload: dict or None
+    :param status_code: HTTP status code
+    :type status_code: int
+    :param text: Response body
+    :type text: str
+
+    :return: Response mock
+    :rtype: Mock
+    """
+    return Mock(
+        spec=requests.Response,
+        status_code=status_code,
+        text=text,
+        content=json.dumps(payload).encode(),
+        **{'json.return_value': payload},
+    )
+
+
+def get_raising_request(exception: Exception) -> Callable:
+    """
+    Return requests method replacement which raises exception.
+
+    :param exception: Exception to raise on every call
+    :type exception: Exception
+
+    :return: Mock function
+    :rtype: Callable
+    """
+    def raising_request(*args, **kwargs):  # pylint: disable=unused-argument
+        raise exception
+    return raising_request
+
+
+@functools.lru_cache(maxsize=2)
 def get_mock_get_response(old: bool = False) -> Callable:
     """
     Return response.get mock.
 
+    Response mocks are built once and looked up by URL path segment for every call.
+    The mock function is cached, so every call with the same argument returns the same one.
+
     :param old: True if old dates are used, False otherwise
     :type old: bool
 
     :return: Mock function
     :rtype: Callable
     """
-    now = datetime.now(pytz.UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    now = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
     if old:
         now -= timedelta(days=20)
 
+    date_format = '%Y-%m-%dT%H'
+    interval_1 = 24
+    count_1 = 141
+    interval_2 = 48
+    count_2 = 3
+    date_1 = (now - timedelta(hours=interval_1 * count_1)).strftime(date_format)
+    date_2 = now.strftime(date_format)
+    responses = {
+        'latlon2rowcol': FakeResponse({'points': [{'col': 150, 'row': 250}]}),
+        'date': FakeResponse({
+            'dates': [
+                {
+                    'starting-date': date_1,
+                    'interval': interval_1,
+                    'count': count_1,
+                },
+                {
+                    'starting-date': date_2,
+                    'interval': interval_2,
+                    'count': count_2,
+                }
+            ]
+        }),
+    }
+    empty_response = FakeResponse({})
+
     def mock_get_response(url, *args, **kwargs):  # pylint: disable=unused-argument
-        response = Mock()
-        response.status_code = 200
-
-        if 'latlon2rowcol' in url:
-            response.json.return_value = {'points': [{'col': 150, 'row': 250}]}
-        elif 'date/' in url:
-            date_format = '%Y-%m-%dT%H'
-            interval_1 = 24
-            count_1 = 141
-            interval_2 = 48
-            count_2 = 3
-            date_1 = (now - timedelta(hours=interval_1 * count_1)).strftime(date_format)
-            date_2 = now.strftime(date_format)
-            response.json.return_value = {
-                'dates': [
-                    {
-                        'starting-date': date_1,
-                        'interval': interval_1,
-                        'count': count_1,
-                    },
-                    {
-                        'starting-date': date_2,
-                        'interval': interval_2,
-                        'count': count_2,
-                    }
-                ]
-            }
-        return response
+        # Dates URL ends with "date/", coordinates URL ends with "latlon2rowcol/<lat>%2C<lon>/"
+        segments = url.rsplit('/', 3)
+        if segments[-2] in responses:
+            return responses[segments[-2]]
+        return responses.get(segments[-3], empty_response)
     return mock_get_response
 
 
-def get_mock_post_response(times_and_vals: dict = None) -> Callable:
+@functools.lru_cache(maxsize=1)
+def get_mock_post_response() -> Callable:
     """
         Return response.post mock.
 
+        Response mocks are built once per field from TIMES_AND_VALS and reused for every call.
+        The mock function is cached, so every call returns the same one.
+
         :return: Mock function
         :rtype: Callable
         """
-    if times_and_vals is None:
-        times_and_vals = get_times_nad_vals()
+    responses = {
+        field: FakeResponse({'times': TIMES_AND_VALS['times'], 'data': vals})
+        for field, vals in TIMES_AND_VALS['vals'].items()
+    }
 
     def mock_post_response(url, *args, **kwargs):  # pylint: disable=unused-argument
-        response = Mock()
-        response.status_code = 200
-
-        match = re.search(r"/field/([^/]+)/", url)
-        if not match:
+        _, separator, rest = url.partition('/field/')
+        if not separator:
             return None
 
-        field = match.group(1)
-
         try:
-            response.json.return_value = {
-                'times': times_and_vals['times'],
-                'data': times_and_vals['vals'][field],
-            }
-        except Exception as e:
+            return responses[rest.partition('/')[0]]
+        except KeyError as e:
             raise NotImplementedError(f"Unsupported field in url: {url}") from e
-        return response
     return mock_post_response
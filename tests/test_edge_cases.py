@@ -8,28 +8,29 @@ Edge cases tests for MeteoForecast class.
 
 # pylint: disable=protected-access
 
+from datetime import datetime, timezone
 from unittest.mock import patch
 
 import pytest
 
 from meteo_forecast.meteo_forecast import MeteoForecast
-from tests.base_test import BaseTest
+from tests.base_test import BaseTest, make_forecast
 
 
 class TestMeteoForecastEdgeCases(BaseTest):
     """Test edge cases and boundary conditions."""
 
+    @pytest.mark.usefixtures('no_set_xy')
     def test_extreme_coordinates(self):
         """Test with extreme latitude/longitude values."""
-        with patch.object(MeteoForecast, '_set_xy'):
-            # Test extreme valid coordinates
-            forecast_north = MeteoForecast(self.api_key, 89.9, 179.9)
-            assert forecast_north.lat == 89.9
-            assert forecast_north.lon == 179.9
+        # Test extreme valid coordinates
+        forecast_north = MeteoForecast(self.api_key, 89.9, 179.9)
+        assert forecast_north.lat == 89.9
+        assert forecast_north.lon == 179.9
 
-            forecast_south = MeteoForecast(self.api_key, -89.9, -179.9)
-            assert forecast_south.lat == -89.9
-            assert forecast_south.lon == -179.9
+        forecast_south = MeteoForecast(self.api_key, -89.9, -179.9)
+        assert forecast_south.lat == -89.9
+        assert forecast_south.lon == -179.9
 
     def test_empty_config_fields(self):
         """Test with empty fields configuration."""
@@ -39,48 +40,73 @@ class TestMeteoForecastEdgeCases(BaseTest):
             'fields': []
         }
 
-        with patch.object(MeteoForecast, '_set_xy'):
-            with pytest.raises(ValueError, match="Fields cannot be empty"):
-                MeteoForecast(self.api_key, 52.0, 21.0, config)
+        with pytest.raises(ValueError, match="Fields cannot be empty"):
+            MeteoForecast(self.api_key, 52.0, 21.0, config)
 
-    def test_invalid_config(self):
-        """Test with invalid configuration."""
+    @pytest.mark.parametrize('config, match', [
         # Missing required keys
-        with patch.object(MeteoForecast, '_set_xy'):
-            with pytest.raises(ValueError, match='Configuration must have "model" key'):
-                MeteoForecast(self.api_key, 52.0, 21.0, {'grid': 'test', 'fields': [('T2', 0)]})
+        ({'grid': 'test', 'fields': [('T2', 0)]}, 'Configuration must have "model" key'),
+        ({'model': 'test', 'fields': [('T2', 0)]}, 'Configuration must have "grid" key'),
+        # Wrong types
+        ({'model': 123, 'grid': 'test', 'fields': [('T2', 0)]}, 'Configuration "model" must be of type str'),
+        ({'model': 'wrf', 'grid': 'test', 'fields': ['invalid']}, 'Each field in "fields" must be a tuple'),
+        ({'model': 'wrf', 'grid': 'test', 'fields': [('T2', 'invalid')]}, 'Each field in "fields" must be a tuple'),
+    ])
+    def test_invalid_config(self, config, match):
+        """Test with invalid configuration."""
+        # Configuration is validated before coordinates are resolved, so no API call is made
+        with pytest.raises(ValueError, match=match):
+            MeteoForecast(self.api_key, 52.0, 21.0, config)
 
-            with pytest.raises(ValueError, match='Configuration must have "grid" key'):
-                MeteoForecast(self.api_key, 52.0, 21.0, {'model': 'test', 'fields': [('T2', 0)]})
+    def test_date_parsing_edge_cases(self):
+        """Test selecting the last forecast date across year end and leap day."""
+        cutoff = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
-            # Wrong types
-            with pytest.raises(ValueError, match='Configuration "model" must be of type str'):
-                MeteoForecast(self.api_key, 52.0, 21.0, {'model': 123, 'grid': 'test', 'fields': [('T2', 0)]})
+        # Test year rollover
+        dates = [{'starting-date': '2024-12-31T23', 'interval': 1, 'count': 2}]
+        assert MeteoForecast._find_last_forecast_date(dates, cutoff) == '2025-01-01T00'
 
-            with pytest.raises(ValueError, match='Each field in "fields" must be a tuple'):
-                MeteoForecast(self.api_key, 52.0, 21.0, {'model': 'wrf', 'grid': 'test', 'fields': ['invalid']})
+        # Test with leap year
+        dates = [{'starting-date': '2024-02-28T12', 'interval': 24, 'count': 2}]
+        assert MeteoForecast._find_last_forecast_date(dates, cutoff) == '2024-02-29T12'
 
-            with pytest.raises(ValueError, match='Each field in "fields" must be a tuple'):
-                MeteoForecast(self.api_key, 52.0, 21.0, {'model': 'wrf', 'grid': 'test', 'fields': [('T2', 'invalid')]})
+    def test_parse_date(self):
+        """Test parsing dates in API format."""
+        assert MeteoForecast._parse_date('2024-02-29T23') == datetime(2024, 2, 29, 23)
 
-    def test_date_parsing_edge_cases(self):
-        """Test date parsing with various formats."""
-        # Test with different date formats
-        date_dict_1 = {
-            'starting-date': '2024-12-31T23',
-            'interval': 1,
-            'count': 2
-        }
+        for value in (
+                'invalid-date-format', '2024-01-01 00', '2024-1-1T0', '2024-13-01T00', '2023-02-29T00',
+                ' 2024-01-01T00', '2024- 1-01T00', '+024-01-01T00', '2024-01-+1T00', '2024-01-01T\u0660\u0661',
+        ):
+            with pytest.raises(ValueError):
+                MeteoForecast._parse_date(value)
 
-        result = MeteoForecast._get_forecast_dates(date_dict_1)
-        assert result == ['2024-12-31T23', '2025-01-01T00']
+    def test_latest_forecast_date_selection(self):
+        """Test that the last date of the newest date series reaching the cutoff is selected."""
+        url = 'http://test.url/field/'
+        dates = {'dates': [
+            {'starting-date': '2024-01-14T00', 'interval': 6, 'count': 4},
+            {'starting-date': '2024-01-15T00', 'interval': 6, 'count': 0},
+            {'starting-date': '2024-01-13T00', 'interval': 6, 'count': 2},
+        ]}
 
-        # Test with leap year
-        date_dict_2 = {
-            'starting-date': '2024-02-28T12',
-            'interval': 24,
-            'count': 2
-        }
+        with patch.object(MeteoForecast, '_connect_meteo_api') as mock_connect:
+            mock_connect.side_effect = [dates, {}]
+            forecast = make_forecast(self.api_key, 52.0, 21.0)
+
+            forecast._fetch_field(('T2', 0), url, datetime(2024, 1, 14, 12, tzinfo=timezone.utc))
+
+            mock_connect.assert_called_with(f'{url}T2/level/0/date/2024-01-14T18/forecast/', True)
+
+    def test_latest_forecast_date_across_year_boundary(self):
+        """Test that the latest forecast date is computed correctly across day, month and year boundaries."""
+        url = 'http://test.url/field/'
+        dates = {'dates': [{'starting-date': '2024-12-31T18', 'interval': 6, 'count': 3}]}
+
+        with patch.object(MeteoForecast, '_connect_meteo_api') as mock_connect:
+            mock_connect.side_effect = [dates, {}]
+            forecast = make_forecast(self.api_key, 52.0, 21.0)
+
+            forecast._fetch_field(('T2', 0), url, datetime(2025, 1, 1, 6, tzinfo=timezone.utc))
 
-        result = MeteoForecast._get_forecast_dates(date_dict_2)
-        assert result == ['2024-02-28T12', '2024-02-29T12']
+            mock_connect.assert_called_with(f'{url}T2/level/0/date/2025-01-01T06/forecast/', True)
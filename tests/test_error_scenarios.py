@@ -7,107 +7,90 @@ Error scenarios tests for MeteoForecast class.
 """
 
 import json
-from unittest.mock import Mock, patch
+import re
+from unittest.mock import patch
 
 import pytest
 import requests
 
 from meteo_forecast.meteo_forecast import MeteoForecast
-from tests.base_test import BaseTest
+from tests.base_test import BaseTest, make_forecast
+from tests.mocks import FROZEN_NOW, T2_CONFIG, get_mock_response, get_raising_request
+
+# Message of ValueError raised for non-200 API responses, compiled once for all HTTP error cases
+_API_ERROR_RE = re.compile(r'Failed to connect to Meteo API: (\d+) - (.*)')
 
 
 class TestMeteoForecastErrorScenarios(BaseTest):
     """Test error scenarios and exception handling."""
 
-    @patch('requests.get')
-    def test_api_authentication_error(self, mock_get):
-        """Test handling of API authentication errors."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.text = 'Unauthorized: Invalid API key'
-        mock_get.return_value = mock_response
-
-        with pytest.raises(ValueError, match="Failed to connect to Meteo API: 401 - Unauthorized: Invalid API key"):
-            MeteoForecast(self.api_key, self.latitude, self.longitude)
-
-    @patch('requests.get')
-    def test_api_rate_limit_error(self, mock_get):
-        """Test handling of API rate limit errors."""
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_response.text = 'Too Many Requests'
-        mock_get.return_value = mock_response
-
-        with pytest.raises(ValueError, match="Failed to connect to Meteo API: 429 - Too Many Requests"):
+    @pytest.fixture
+    def forecast(self):
+        """MeteoForecast instance with T2 field and grid coordinates set without API calls."""
+        return make_forecast(self.api_key, self.latitude, self.longitude, T2_CONFIG)
+
+    @pytest.mark.parametrize('status_code, text', [
+        (401, 'Unauthorized: Invalid API key'),
+        (404, 'Not Found'),
+        (429, 'Too Many Requests'),
+        (500, 'Internal Server Error'),
+    ])
+    def test_api_http_error(self, monkeypatch, status_code, text):
+        """Test handling of API authentication, missing resource, rate limit and server errors."""
+        response = get_mock_response(status_code=status_code, text=text)
+        monkeypatch.setattr(requests.Session, 'get', lambda *args, **kwargs: response)
+
+        with pytest.raises(ValueError) as error:
             MeteoForecast(self.api_key, self.latitude, self.longitude)
 
-    @patch('requests.get')
-    def test_api_server_error(self, mock_get):
-        """Test handling of API server errors."""
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.text = 'Internal Server Error'
-        mock_get.return_value = mock_response
+        match = _API_ERROR_RE.fullmatch(str(error.value))
+        assert match is not None
+        assert match.groups() == (str(status_code), text)
 
-        with pytest.raises(ValueError, match="Failed to connect to Meteo API: 500 - Internal Server Error"):
-            MeteoForecast(self.api_key, self.latitude, self.longitude)
-
-    @patch('requests.get')
-    def test_network_connection_error(self, mock_get):
+    def test_network_connection_error(self, monkeypatch):
         """Test handling of network connection errors."""
-        mock_get.side_effect = requests.ConnectionError("Failed to establish connection")
+        monkeypatch.setattr(requests.Session, 'get', get_raising_request(requests.ConnectionError("Failed to establish connection")))
 
         with pytest.raises(requests.ConnectionError):
             MeteoForecast(self.api_key, self.latitude, self.longitude)
 
-    @patch('requests.get')
-    def test_network_timeout_error(self, mock_get):
+    def test_network_timeout_error(self, monkeypatch):
         """Test handling of network timeout errors."""
-        mock_get.side_effect = requests.Timeout("Request timed out")
+        monkeypatch.setattr(requests.Session, 'get', get_raising_request(requests.Timeout("Request timed out")))
 
         with pytest.raises(requests.Timeout):
             MeteoForecast(self.api_key, self.latitude, self.longitude)
 
-    @patch('requests.get')
-    def test_invalid_json_response(self, mock_get):
+    def test_invalid_json_response(self, monkeypatch):
         """Test handling of invalid JSON responses."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-        mock_get.return_value = mock_response
+        response = get_mock_response()
+        response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
+        response.content = b'Invalid JSON'
+        monkeypatch.setattr(requests.Session, 'get', lambda *args, **kwargs: response)
 
         with pytest.raises(json.JSONDecodeError):
             MeteoForecast(self.api_key, self.latitude, self.longitude)
 
-    @patch('requests.get')
-    def test_missing_points_in_response(self, mock_get):
+    def test_missing_points_in_response(self, monkeypatch):
         """Test handling of missing 'points' key in API response."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'error': 'No points found'}
-        mock_get.return_value = mock_response
+        response = get_mock_response({'error': 'No points found'})
+        monkeypatch.setattr(requests.Session, 'get', lambda *args, **kwargs: response)
 
         with pytest.raises(KeyError):
             MeteoForecast(self.api_key, self.latitude, self.longitude)
 
-    @patch('requests.get')
-    def test_empty_points_array(self, mock_get):
+    def test_empty_points_array(self, monkeypatch):
         """Test handling of empty points array in API response."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'points': []}
-        mock_get.return_value = mock_response
+        response = get_mock_response({'points': []})
+        monkeypatch.setattr(requests.Session, 'get', lambda *args, **kwargs: response)
 
         with pytest.raises(IndexError):
             MeteoForecast(self.api_key, self.latitude, self.longitude)
 
-    @patch('requests.get')
-    def test_malformed_coordinates_response(self, mock_get):
+    def test_malformed_coordinates_response(self, monkeypatch):
         """Test handling of malformed coordinates in API response."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'points': [{'invalid': 'data'}]}
-        mock_get.return_value = mock_response
+        response = get_mock_response({'points': [{'invalid': 'data'}]})
+        monkeypatch.setattr(requests.Session, 'get', lambda *args, **kwargs: response)
 
         with pytest.raises(KeyError):
             MeteoForecast(self.api_key, self.latitude, self.longitude)
@@ -118,16 +101,16 @@ class TestMeteoForecastErrorScenarios(BaseTest):
             # This should fail when trying to use a non-string API key
             MeteoForecast(None, self.latitude, self.longitude)
 
+    @pytest.mark.usefixtures('no_set_xy')
     def test_invalid_coordinate_types(self):
         """Test handling of invalid coordinate types."""
-        with patch.object(MeteoForecast, '_set_xy'):
-            # Should handle string coordinates
-            forecast = MeteoForecast(self.api_key, "52.2297", "21.0122")
-            assert forecast.lat == "52.2297"
-            assert forecast.lon == "21.0122"
+        # Should handle string coordinates
+        forecast = MeteoForecast(self.api_key, "52.2297", "21.0122")
+        assert forecast.lat == "52.2297"
+        assert forecast.lon == "21.0122"
 
     @patch.object(MeteoForecast, '_connect_meteo_api')
-    def test_forecast_with_no_valid_dates(self, mock_connect):
+    def test_forecast_with_no_valid_dates(self, mock_connect, forecast):
         """Test forecast retrieval when no valid dates are available."""
         def mock_api_response(url, post=False):
             if 'date/' in url and not post:
@@ -136,28 +119,16 @@ class TestMeteoForecastErrorScenarios(BaseTest):
 
         mock_connect.side_effect = mock_api_response
 
-        with patch.object(MeteoForecast, '_set_xy'):
-            forecast = MeteoForecast(self.api_key, self.latitude, self.longitude, {
-                'model': 'wrf',
-                'grid': 'd02_XLONG_XLAT',
-                'fields': [('T2', 0)]
-            })
-            forecast.x = 100
-            forecast.y = 200
-
-            import warnings
-            with warnings.catch_warnings(record=True) as w:
-                warnings.simplefilter("always")
-                result = forecast.get_forecast()
-
-                # Should get warning about failed field
-                assert len(w) == 1
-                assert "Failed to fetch data for field T2" in str(w[0].message)
-                assert isinstance(result, dict)
-                assert not result
+        with pytest.warns(UserWarning, match="Failed to fetch data for field T2") as w:
+            result = forecast.get_forecast()
+
+        # Should get warning about failed field
+        assert len(w) == 1
+        assert isinstance(result, dict)
+        assert not result
 
     @patch.object(MeteoForecast, '_connect_meteo_api')
-    def test_forecast_with_malformed_date_data(self, mock_connect):
+    def test_forecast_with_malformed_date_data(self, mock_connect, forecast):
         """Test forecast retrieval with malformed date data."""
         def mock_api_response(url, post=False):
             if 'date/' in url and not post:
@@ -172,76 +143,36 @@ class TestMeteoForecastErrorScenarios(BaseTest):
 
         mock_connect.side_effect = mock_api_response
 
-        with patch.object(MeteoForecast, '_set_xy'):
-            forecast = MeteoForecast(self.api_key, self.latitude, self.longitude, {
-                'model': 'wrf',
-                'grid': 'd02_XLONG_XLAT',
-                'fields': [('T2', 0)]
-            })
-            forecast.x = 100
-            forecast.y = 200
-
-            import warnings
-            with warnings.catch_warnings(record=True) as w:
-                warnings.simplefilter("always")
-                result = forecast.get_forecast()
-
-                # Should get warning about failed field due to date parsing error
-                assert len(w) == 1
-                assert "Failed to fetch data for field T2" in str(w[0].message)
-                assert isinstance(result, dict)
-                assert not result
-
-    @patch('requests.post')
-    def test_forecast_post_request_failure(self, mock_post):
+        with pytest.warns(UserWarning, match="Failed to fetch data for field T2") as w:
+            result = forecast.get_forecast()
+
+        # Should get warning about failed field due to date parsing error
+        assert len(w) == 1
+        assert isinstance(result, dict)
+        assert not result
+
+    def test_forecast_post_request_failure(self, monkeypatch):
         """Test handling of POST request failures during forecast retrieval."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.text = 'Not Found'
-        mock_post.return_value = mock_response
-
-        with patch.object(MeteoForecast, '_set_xy'), \
-             patch.object(MeteoForecast, '_connect_meteo_api') as mock_connect:
-
-            def mock_api_response(*args, post=False, **kwargs):  # pylint: disable=unused-argument
-                if not post:
-                    return {
-                        'dates': [{
-                            'starting-date': '2024-01-14T00',
-                            'interval': 6,
-                            'count': 4
-                        }]
-                    }
-                # This will trigger the POST request which will fail
-                raise ValueError("Failed to connect to Meteo API: 404 - Not Found")
-
-            mock_connect.side_effect = mock_api_response
-
-            forecast = MeteoForecast(self.api_key, self.latitude, self.longitude, {
-                'model': 'wrf',
-                'grid': 'd02_XLONG_XLAT',
-                'fields': [('T2', 0)]
-            })
-            forecast.x = 100
-            forecast.y = 200
-
-            with patch('meteo_forecast.meteo_forecast.datetime') as mock_datetime:
-                from datetime import datetime
-
-                import pytz
-                mock_datetime.now.return_value = datetime(2024, 1, 15, 12, 0, 0, tzinfo=pytz.UTC)
-                mock_datetime.strptime = datetime.strptime
-
-                import warnings
-                with warnings.catch_warnings(record=True) as w:
-                    warnings.simplefilter("always")
-                    result = forecast.get_forecast()
-
-                    # Should get warning about failed field
-                    assert len(w) == 1
-                    assert "Failed to fetch data for field T2" in str(w[0].message)
-                    assert isinstance(result, dict)
-                    assert not result
+        forecast = make_forecast(self.api_key, self.latitude, self.longitude, T2_CONFIG, now_provider=lambda: FROZEN_NOW)
+        dates_response = get_mock_response({
+            'dates': [{
+                'starting-date': '2024-01-14T00',
+                'interval': 6,
+                'count': 4
+            }]
+        })
+        monkeypatch.setattr(requests.Session, 'get', lambda *args, **kwargs: dates_response)
+        # Forecast POST goes through _connect_meteo_api_ and fails with 404
+        response = get_mock_response(status_code=404, text='Not Found')
+        monkeypatch.setattr(requests.Session, 'post', lambda *args, **kwargs: response)
+
+        with pytest.warns(UserWarning, match="Failed to fetch data for field T2 at level 0: Failed to connect to Meteo API: 404 - Not Found") as w:
+            result = forecast.get_forecast()
+
+        # Should get warning about failed POST request
+        assert len(w) == 1
+        assert isinstance(result, dict)
+        assert not result
 
     def test_static_methods_with_invalid_parameters(self):
         """Test static methods with invalid parameters."""
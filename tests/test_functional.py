@@ -8,27 +8,32 @@ Functional tests for MeteoForecast class.
 
 from unittest.mock import patch
 
+import pytest
+
 from meteo_forecast.meteo_forecast import MeteoForecast
 from tests.base_test import BaseTest
-from tests.mocks import get_mock_get_response, get_mock_post_response
+from tests.mocks import T2_CONFIG
+
+# Mocked metadata API responses, keyed by exact request URL
+_GRID_URL = f'{MeteoForecast.base_url}wrf/grid/d02_XLONG_XLAT/'
+_FIELDS_URL = f'{_GRID_URL}coordinates/200%2C100/field/'
+_METADATA_RESPONSES = {
+    MeteoForecast.base_url: {'models': ['wrf', 'gfs']},
+    f'{MeteoForecast.base_url}wrf/grid/': {'grids': ['d01', 'd02_XLONG_XLAT']},
+    f'{_GRID_URL}latlon2rowcol/{BaseTest.latitude}%2C{BaseTest.longitude}/': {'points': [{'col': 100, 'row': 200}]},
+    _FIELDS_URL: {'fields': ['T2', 'RAINNC', 'U10']},
+    f'{_FIELDS_URL}T2/level/': {'levels': [0, 850, 500]},
+}
 
 
 class TestMeteoForecastFunctional(BaseTest):
     """Functional tests for MeteoForecast class - testing complete workflows."""
 
-    @patch('requests.get')
-    @patch('requests.post')
-    def test_complete_forecast_workflow(self, mock_post, mock_get):
+    @pytest.mark.usefixtures('meteo_api')
+    def test_complete_forecast_workflow(self):
         """Test complete workflow from initialization to forecast retrieval."""
-        mock_get.side_effect = get_mock_get_response()
-        mock_post.side_effect = get_mock_post_response()
-
         # Initialize forecast object
-        forecast = MeteoForecast(self.api_key, self.latitude, self.longitude, {
-            'model': 'wrf',
-            'grid': 'd02_XLONG_XLAT',
-            'fields': [('T2', 0)]
-        })
+        forecast = MeteoForecast(self.api_key, self.latitude, self.longitude, T2_CONFIG)
 
         # Verify initialization
         assert forecast.x == 150
@@ -41,37 +46,15 @@ class TestMeteoForecastFunctional(BaseTest):
         assert isinstance(result, dict)
         assert len(result) == 3
 
+    @pytest.mark.parametrize('method, args, expected', [
+        ('available_models', (), ['wrf', 'gfs']),
+        ('available_grids', ('wrf',), ['d01', 'd02_XLONG_XLAT']),
+        ('available_fields', ('wrf', 'd02_XLONG_XLAT', BaseTest.latitude, BaseTest.longitude), ['T2', 'RAINNC', 'U10']),
+        ('available_levels', ('wrf', 'd02_XLONG_XLAT', 'T2', BaseTest.latitude, BaseTest.longitude), [0, 850, 500]),
+    ])
     @patch.object(MeteoForecast, '_connect_meteo_api_')
-    def test_metadata_retrieval_workflow(self, mock_connect):
-        """Test workflow for retrieving available models, grids, fields, and levels."""
-
-        # Mock different API responses
-        def mock_api_response(api_key, url):  # pylint: disable=unused-argument
-            if url == MeteoForecast.base_url:
-                return {'models': ['wrf', 'gfs']}
-            if 'latlon2rowcol' in url:
-                return {'points': [{'col': 100, 'row': 200}]}
-            if 'grid/' in url and 'coordinates' not in url:
-                return {'grids': ['d01', 'd02_XLONG_XLAT']}
-            if 'field/' in url and 'level' not in url:
-                return {'fields': ['T2', 'RAINNC', 'U10']}
-            if 'level/' in url:
-                return {'levels': [0, 850, 500]}
-            return {}
-
-        mock_connect.side_effect = mock_api_response
-
-        # Test complete metadata retrieval workflow
-        models = MeteoForecast.available_models(self.api_key)
-        assert models == ['wrf', 'gfs']
-
-        grids = MeteoForecast.available_grids(self.api_key, 'wrf')
-        assert grids == ['d01', 'd02_XLONG_XLAT']
-
-        fields = MeteoForecast.available_fields(self.api_key, 'wrf', 'd02_XLONG_XLAT',
-                                                self.latitude, self.longitude)
-        assert fields == ['T2', 'RAINNC', 'U10']
+    def test_metadata_retrieval_workflow(self, mock_connect, method, args, expected):
+        """Test retrieving available models, grids, fields, and levels."""
+        mock_connect.side_effect = lambda api_key, url, session=None: _METADATA_RESPONSES[url]
 
-        levels = MeteoForecast.available_levels(self.api_key, 'wrf', 'd02_XLONG_XLAT', 'T2',
-                                                self.latitude, self.longitude)
-        assert levels == [0, 850, 500]
+        assert getattr(MeteoForecast, method)(self.api_key, *args) == expected
@@ -6,55 +6,54 @@ For details, see the LICENSE file in the project root.
 Integration tests for MeteoForecast class.
 """
 
-import warnings
+import asyncio
 from unittest.mock import patch
 
 import pytest
 import requests
 
 from meteo_forecast.meteo_forecast import MeteoForecast
-from tests.base_test import BaseTest
+from tests.base_test import BaseTest, make_forecast
 from tests.mocks import (
-    get_mock_get_response,
-    get_mock_post_response,
-    get_times_nad_vals,
+    T2_CONFIG,
+    T2_RAINNC_CONFIG,
+    TIMES_AND_VALS,
 )
 
 
 class TestMeteoForecastIntegration(BaseTest):
     """Integration tests for MeteoForecast class - testing method interactions."""
 
-    @patch.object(MeteoForecast, '_connect_meteo_api')
-    def test_get_forecast_integration(self, mock_connect):
+    @pytest.mark.usefixtures('meteo_api')
+    def test_get_forecast_integration(self):
         """Test get_forecast method integration with multiple API calls."""
-        times_and_vals = get_times_nad_vals()
+        config = T2_CONFIG
 
-        def mock_api_response(url, post=False):
-            if post:
-                return get_mock_post_response(times_and_vals)(url).json()
-            return get_mock_get_response()(url).json()
+        forecast = make_forecast(self.api_key, self.latitude, self.longitude, config)
 
-        mock_connect.side_effect = mock_api_response
-        config = {
-            'model': 'wrf',
-            'grid': 'd02_XLONG_XLAT',
-            'fields': [('T2', 0)]
-        }
+        result = forecast.get_forecast()
 
-        with patch.object(MeteoForecast, '_set_xy'):
-            forecast = MeteoForecast(self.api_key, self.latitude, self.longitude, config)
-            forecast.x = 100
-            forecast.y = 200
+        # Verify structure of returned data
+        assert isinstance(result, dict)
+        for i, time in enumerate(TIMES_AND_VALS['times']):
+            assert time in result
+            for field, level in config['fields']:
+                assert field in result[time]
+                assert result[time][field][level] == TIMES_AND_VALS['vals'][field][i]
 
-            result = forecast.get_forecast()
+    @pytest.mark.usefixtures('meteo_api')
+    def test_get_forecast_async_integration(self):
+        """Test get_forecast_async returns the same data as get_forecast."""
+        config = T2_RAINNC_CONFIG
+
+        forecast = make_forecast(self.api_key, self.latitude, self.longitude, config)
+
+        result = asyncio.run(forecast.get_forecast_async())
 
-            # Verify structure of returned data
-            assert isinstance(result, dict)
-            for i, time in enumerate(times_and_vals['times']):
-                assert time in result
-                for field, level in config['fields']:
-                    assert field in result[time]
-                    assert result[time][field][level] == times_and_vals['vals'][field][i]
+        assert result == forecast.get_forecast()
+        for i, time in enumerate(TIMES_AND_VALS['times']):
+            for field, level in config['fields']:
+                assert result[time][field][level] == TIMES_AND_VALS['vals'][field][i]
 
     @patch.object(MeteoForecast, '_connect_meteo_api')
     def test_get_forecast_with_warnings(self, mock_connect):
@@ -66,31 +65,40 @@ class TestMeteoForecastIntegration(BaseTest):
 
         mock_connect.side_effect = mock_api_response
 
-        with patch.object(MeteoForecast, '_set_xy'):
-            forecast = MeteoForecast(self.api_key, self.latitude, self.longitude, {
-                'model': 'wrf',
-                'grid': 'd02_XLONG_XLAT',
-                'fields': [('T2', 0), ('RAINNC', 0)]
-            })
-            forecast.x = 100
-            forecast.y = 200
-
-            with warnings.catch_warnings(record=True) as w:
-                warnings.simplefilter("always")
-                result = forecast.get_forecast()
-
-                # Check that warnings were issued for failed fields
-                assert len(w) >= 2  # At least one warning per field
-                # Check that result is empty when all fields fail
-                assert isinstance(result, dict)
-                assert not result
+        forecast = make_forecast(self.api_key, self.latitude, self.longitude, T2_RAINNC_CONFIG)
+
+        with pytest.warns(UserWarning) as w:
+            result = forecast.get_forecast()
+
+        # Check that a single warning lists all failed fields
+        assert len(w) == 1
+        assert "field T2 at level 0: Network error" in str(w[0].message)
+        assert "field RAINNC at level 0: Network error" in str(w[0].message)
+        # Check that result is empty when all fields fail
+        assert isinstance(result, dict)
+        assert not result
+
+    @patch.object(MeteoForecast, '_fetch_field')
+    def test_get_forecast_fetches_duplicated_fields_once(self, mock_fetch_field):
+        """Test that repeated (field, level) pairs in config are requested only once."""
+        mock_fetch_field.return_value = {'times': ['2024-01-01T06:00:00Z'], 'data': [20.5]}
+        config = {
+            'model': 'wrf',
+            'grid': 'd02_XLONG_XLAT',
+            'fields': [('T2', 0), ('RAINNC', 0), ('T2', 0), ('T2', 2)]
+        }
+
+        forecast = make_forecast(self.api_key, self.latitude, self.longitude, config)
+        result = forecast.get_forecast()
+
+        assert [c.args[0] for c in mock_fetch_field.call_args_list] == [('T2', 0), ('RAINNC', 0), ('T2', 2)]
+        assert result == {'2024-01-01T06:00:00Z': {'T2': {0: 20.5, 2: 20.5}, 'RAINNC': {0: 20.5}}}
 
     def test_get_forecast_with_missing_coordinates(self):
         """Test get_forecast with missing coordinates."""
-        with patch.object(MeteoForecast, '_set_xy'):
-            meteo = MeteoForecast(self.api_key)
-            with pytest.raises(ValueError, match="Coordinates must be set before fetching the forecast"):
-                meteo.get_forecast()
+        meteo = MeteoForecast(self.api_key)
+        with pytest.raises(ValueError, match="Coordinates must be set before fetching the forecast"):
+            meteo.get_forecast()
 
     @pytest.mark.filterwarnings("ignore:Failed to fetch data for field")
     @patch.object(MeteoForecast, 'get_xy')
@@ -113,13 +121,12 @@ class TestMeteoForecastIntegration(BaseTest):
                         f'/date/')
         mock_get_xy.return_value = (x_expected, y_expected)
 
-        with patch.object(MeteoForecast, '_set_xy'):
-            meteo = MeteoForecast(self.api_key, config={
-                'model': model,
-                'grid': grid,
-                'fields': [(field, level)]
-            })
+        meteo = MeteoForecast(self.api_key, config={
+            'model': model,
+            'grid': grid,
+            'fields': [(field, level)]
+        })
 
-            with patch.object(meteo, '_connect_meteo_api') as mock_meteo_api:
-                meteo.get_forecast(latitude, longitude)
-                mock_meteo_api.assert_called_with(expected_url)
+        with patch.object(MeteoForecast, '_connect_meteo_api') as mock_meteo_api:
+            meteo.get_forecast(latitude, longitude)
+            mock_meteo_api.assert_called_with(expected_url)
@@ -7,56 +7,65 @@ Performance tests for MeteoForecast class.
 """
 
 import time
-from unittest.mock import Mock, patch
+from types import MappingProxyType
+from unittest.mock import patch
 
 import pytest
+import requests
 
 from meteo_forecast.meteo_forecast import MeteoForecast
 from tests.base_test import BaseTest
-from tests.mocks import get_mock_get_response, get_mock_post_response
+from tests.mocks import get_mock_response
+
+# Read-only configuration with many fields, built once at import
+_LARGE_CONFIG = MappingProxyType({
+    'model': 'wrf',
+    'grid': 'd02_XLONG_XLAT',
+    'fields': [(f'FIELD_{i}', 0) for i in range(50)]
+})
 
 
 class TestMeteoForecastPerformance(BaseTest):
     """Performance tests for MeteoForecast class."""
 
-    @patch('requests.get')
-    @patch('requests.post')
-    def test_forecast_response_time(self, mock_post, mock_get):
+    @pytest.mark.usefixtures('meteo_api')
+    def test_forecast_response_time(self):
         """Test that forecast retrieval completes within acceptable time."""
-        mock_get.side_effect = get_mock_get_response()
-        mock_post.side_effect = get_mock_post_response()
-
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         forecast = MeteoForecast(self.api_key, self.latitude, self.longitude)
         result = forecast.get_forecast()
 
-        end_time = time.time()
+        end_time = time.perf_counter()
         execution_time = end_time - start_time
 
         # Should complete within 1 second (mocked responses)
         assert execution_time < 1.0
         assert len(result) > 0
 
-    @patch('requests.get')
-    def test_multiple_instances_performance(self, mock_get):
-        """Test performance with multiple MeteoForecast instances."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'points': [{'col': 100, 'row': 200}]}
-        mock_get.return_value = mock_response
+    @pytest.fixture
+    def forecast_factory(self, monkeypatch):
+        """Return function creating MeteoForecast instances with grid coordinates lookup served by a mock."""
+        response = get_mock_response({'points': [{'col': 100, 'row': 200}]})
+        monkeypatch.setattr(requests.Session, 'get', lambda *args, **kwargs: response)
+        instances = []
+
+        def make(latitude, longitude):
+            forecast = MeteoForecast(self.api_key, latitude, longitude)
+            instances.append(forecast)
+            return forecast
+        yield make
+        for forecast in instances:
+            forecast.close()
 
-        start_time = time.time()
+    def test_multiple_instances_performance(self, forecast_factory):
+        """Test performance with multiple MeteoForecast instances."""
+        start_time = time.perf_counter()
 
         # Create multiple instances
-        instances = []
-        for i in range(10):
-            lat = 52.0 + i * 0.1
-            lon = 21.0 + i * 0.1
-            instance = MeteoForecast(self.api_key, lat, lon)
-            instances.append(instance)
+        instances = [forecast_factory(52.0 + i * 0.1, 21.0 + i * 0.1) for i in range(10)]
 
-        end_time = time.time()
+        end_time = time.perf_counter()
         execution_time = end_time - start_time
 
         # Should create 10 instances within reasonable time
@@ -67,25 +76,21 @@ class TestMeteoForecastPerformance(BaseTest):
         for i, instance in enumerate(instances):
             assert instance.lat == 52.0 + i * 0.1
             assert instance.lon == 21.0 + i * 0.1
+            assert (instance.x, instance.y) == (100, 200)
+        # Every instance owns its HTTP session, closing one does not affect the others
+        assert len({id(instance._session) for instance in instances}) == 10  # pylint: disable=protected-access
 
+    @pytest.mark.usefixtures('no_set_xy')
     @patch.object(MeteoForecast, '_connect_meteo_api_')
     def test_large_field_list_performance(self, mock_connect):
         """Test performance with large number of fields."""
         mock_connect.return_value = {'points': [{'col': 100, 'row': 200}]}
 
-        # Create config with many fields
-        large_config = {
-            'model': 'wrf',
-            'grid': 'd02_XLONG_XLAT',
-            'fields': [(f'FIELD_{i}', 0) for i in range(50)]
-        }
-
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        with patch.object(MeteoForecast, '_set_xy'):
-            forecast = MeteoForecast(self.api_key, self.latitude, self.longitude, large_config)
+        forecast = MeteoForecast(self.api_key, self.latitude, self.longitude, _LARGE_CONFIG)
 
-        end_time = time.time()
+        end_time = time.perf_counter()
         execution_time = end_time - start_time
 
         # Should handle large config efficiently
@@ -93,16 +98,21 @@ class TestMeteoForecastPerformance(BaseTest):
         assert len(forecast.config['fields']) == 50
 
     @pytest.mark.slow
-    @patch('requests.get')
-    @patch('requests.post')
-    def test_stress_forecast_retrieval(self, mock_post, mock_get):
+    @pytest.mark.usefixtures('meteo_api')
+    def test_stress_forecast_retrieval(self, monkeypatch):
         """Stress test for multiple forecast retrievals."""
-        mock_get.side_effect = get_mock_get_response()
-        mock_post.side_effect = get_mock_post_response()
-
+        get = requests.Session.get
+        date_urls = []
+
+        def counting_get(url, *args, **kwargs):
+            if url.endswith('/date/'):
+                date_urls.append(url)
+            return get(url, *args, **kwargs)
+        monkeypatch.setattr(requests.Session, 'get', staticmethod(counting_get))
+        monkeypatch.setattr(MeteoForecast, 'response_cache_ttl', 300)
         forecast = MeteoForecast(self.api_key, self.latitude, self.longitude)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Perform multiple forecast retrievals
         results = []
@@ -110,7 +120,7 @@ class TestMeteoForecastPerformance(BaseTest):
             result = forecast.get_forecast()
             results.append(result)
 
-        end_time = time.time()
+        end_time = time.perf_counter()
         execution_time = end_time - start_time
 
         # Should complete 20 retrievals within reasonable time
@@ -121,3 +131,6 @@ class TestMeteoForecastPerformance(BaseTest):
         for result in results:
             assert isinstance(result, dict)
             assert len(result) > 0
+
+        # Forecast dates are fetched only by the first retrieval, later ones reuse the instance response cache
+        assert len(date_urls) == len(MeteoForecast.default_config['fields'])
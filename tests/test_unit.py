@@ -6,48 +6,90 @@ For details, see the LICENSE file in the project root.
 Unit tests for MeteoForecast class.
 """
 
-# pylint: disable=protected-access
+# pylint: disable=protected-access,too-many-public-methods
 
-from unittest.mock import Mock, patch
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import call, patch
 
 import pytest
+import requests
+from urllib3.response import HTTPResponse
 
 from meteo_forecast.meteo_forecast import MeteoForecast
-from tests.base_test import BaseTest
+from tests.base_test import BaseTest, make_forecast
+from tests.mocks import T2_CONFIG, get_mock_response
 
 
 class TestMeteoForecastUnit(BaseTest):
     """Unit tests for MeteoForecast class."""
 
+    @pytest.mark.usefixtures('no_set_xy')
     def test_init_with_default_config(self):
         """Test MeteoForecast initialization with default configuration."""
-        with patch.object(MeteoForecast, '_set_xy'):
-            model = MeteoForecast.default_config['model']
-            grid = MeteoForecast.default_config['grid']
-            forecast = MeteoForecast(self.api_key, self.latitude, self.longitude)
+        model = MeteoForecast.default_config['model']
+        grid = MeteoForecast.default_config['grid']
+        forecast = MeteoForecast(self.api_key, self.latitude, self.longitude)
+
+        assert forecast.lat == self.latitude
+        assert forecast.lon == self.longitude
+        assert forecast.api_key == self.api_key
+        assert forecast.config == MeteoForecast.default_config
+        assert forecast.main_url == f'{MeteoForecast.base_url}{model}/grid/{grid}/'
 
-            assert forecast.lat == self.latitude
-            assert forecast.lon == self.longitude
-            assert forecast.api_key == self.api_key
-            assert forecast.config == MeteoForecast.default_config
-            assert forecast.main_url == f'{MeteoForecast.base_url}{model}/grid/{grid}/'
+    @pytest.mark.usefixtures('no_set_xy')
+    def test_instance_has_no_dict(self):
+        """Test that instances use slots instead of per-instance dictionary."""
+        forecast = MeteoForecast(self.api_key, self.latitude, self.longitude)
 
+        assert not hasattr(forecast, '__dict__')
+        with pytest.raises(AttributeError):
+            forecast.unknown_attribute = 1  # pylint: disable=assigning-non-slot
+
+    @pytest.mark.usefixtures('no_set_xy')
     def test_init_with_custom_config(self):
         """Test MeteoForecast initialization with custom configuration."""
-        with patch.object(MeteoForecast, '_set_xy'):
-            forecast = MeteoForecast(self.api_key, self.latitude, self.longitude, self.test_config)
+        forecast = MeteoForecast(self.api_key, self.latitude, self.longitude, self.test_config)
+
+        assert forecast.config == self.test_config
+
+    def test_prepare_forecast_uses_now_provider(self):
+        """Test that the oldest acceptable forecast date is 24 full hours before the date from now_provider."""
+        now = datetime(2024, 1, 15, 12, 34, 56, tzinfo=timezone.utc)
+        forecast = make_forecast(self.api_key, self.latitude, self.longitude, now_provider=lambda: now)
 
-            assert forecast.config == self.test_config
+        _, _, cutoff = forecast._prepare_forecast(None, None, None)
 
-    @patch('requests.get')
+        assert cutoff == datetime(2024, 1, 14, 12, tzinfo=timezone.utc)
+
+    def test_prepare_forecast_converts_now_to_utc(self):
+        """Test that date from now_provider in other timezone is converted to UTC before computing the cutoff."""
+        # 2024-01-14T23:30 UTC
+        now = datetime(2024, 1, 15, 1, 30, tzinfo=timezone(timedelta(hours=2)))
+        forecast = make_forecast(self.api_key, self.latitude, self.longitude, now_provider=lambda: now)
+
+        _, _, cutoff = forecast._prepare_forecast(None, None, None)
+
+        assert cutoff == datetime(2024, 1, 13, 23, tzinfo=timezone.utc)
+        assert cutoff.utcoffset() == timedelta(0)
+        dates = [{'starting-date': '2024-01-13T17', 'interval': 6, 'count': 2}]
+        assert MeteoForecast._find_last_forecast_date(dates, cutoff) == '2024-01-13T23'
+
+    def test_prepare_forecast_naive_now(self):
+        """Test that naive date from now_provider is rejected."""
+        forecast = make_forecast(self.api_key, self.latitude, self.longitude, now_provider=lambda: datetime(2024, 1, 15))
+
+        with pytest.raises(ValueError, match='now_provider must return timezone aware date'):
+            forecast._prepare_forecast(None, None, None)
+
+    @patch('requests.Session.get')
     def test_connect_meteo_api_static_get_success(self, mock_get):
         """Test static API connection method with GET request - success case."""
         api_key = 'test_key'
         expected_result = {'data': 'test'}
         url = 'http://test.url'
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = expected_result
+        mock_response = get_mock_response(expected_result)
         mock_get.return_value = mock_response
 
         result = MeteoForecast._connect_meteo_api_(api_key, url)
@@ -55,15 +97,13 @@ class TestMeteoForecastUnit(BaseTest):
         assert result == expected_result
         mock_get.assert_called_once_with(url, headers={'Authorization': f'Token {api_key}'}, timeout=5)
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_connect_meteo_api_static_post_success(self, mock_post):
         """Test static API connection method with POST request - success case."""
         api_key = 'test_key'
         expected_result = {'data': 'test'}
         url = 'http://test.url'
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = expected_result
+        mock_response = get_mock_response(expected_result)
         mock_post.return_value = mock_response
 
         result = MeteoForecast._connect_meteo_api_(api_key, url, post=True)
@@ -71,31 +111,162 @@ class TestMeteoForecastUnit(BaseTest):
         assert result == expected_result
         mock_post.assert_called_once_with(url, headers={'Authorization': f'Token {api_key}'}, timeout=5)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
+    def test_connect_meteo_api_static_reuses_headers(self, mock_get):
+        """Test that authorization headers are built once per API key."""
+        mock_get.return_value = get_mock_response({'data': 'test'})
+
+        MeteoForecast._connect_meteo_api_('test_key', 'http://test.url/a')
+        MeteoForecast._connect_meteo_api_('test_key', 'http://test.url/b')
+        MeteoForecast._connect_meteo_api_('other_key', 'http://test.url/a')
+
+        headers = [kwargs['headers'] for _, kwargs in mock_get.call_args_list]
+        assert headers[0] is headers[1]
+        assert headers[2] == {'Authorization': 'Token other_key'}
+
+    @patch('meteo_forecast.meteo_forecast.orjson', None)
+    @patch('requests.Session.get')
+    def test_connect_meteo_api_static_without_orjson(self, mock_get):
+        """Test static API connection method falls back to requests JSON decoding when orjson is missing."""
+        expected_result = {'data': 'test'}
+        mock_response = get_mock_response(expected_result)
+        mock_get.return_value = mock_response
+
+        result = MeteoForecast._connect_meteo_api_('test_key', 'http://test.url')
+
+        assert result == expected_result
+        mock_response.json.assert_called_once_with()
+
+    @patch('requests.Session.get')
     def test_connect_meteo_api_static_failure(self, mock_get):
         """Test static API connection method - failure case."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.text = 'Unauthorized'
+        mock_response = get_mock_response(status_code=401, text='Unauthorized')
         mock_get.return_value = mock_response
 
-        with pytest.raises(ValueError, match="Failed to connect to Meteo API: 401 - Unauthorized"):
+        with pytest.raises(ValueError) as error:
             MeteoForecast._connect_meteo_api_('invalid_key', 'http://test.url')
 
+        # Message is fixed, so it is compared directly instead of matching a regex
+        assert str(error.value) == "Failed to connect to Meteo API: 401 - Unauthorized"
+
+    @patch('requests.Session.post')
+    def test_connect_meteo_api_static_session(self, mock_post):
+        """Test static API connection method reusing a session."""
+        api_key = 'test_key'
+        expected_result = {'data': 'test'}
+        url = 'http://test.url'
+        mock_response = get_mock_response(expected_result)
+        mock_post.return_value = mock_response
+
+        result = MeteoForecast._connect_meteo_api_(api_key, url, post=True, session=requests.Session())
+
+        assert result == expected_result
+        mock_post.assert_called_once_with(url, headers={'Authorization': f'Token {api_key}'}, timeout=5)
+
+    def test_shared_session_created_once(self):
+        """Test that static API calls without a session share one lazily created session."""
+        with patch.object(MeteoForecast, '_shared_session', None), \
+                patch.object(MeteoForecast, '_create_session', wraps=MeteoForecast._create_session) as mock_create:
+            session = MeteoForecast._get_shared_session()
+
+            assert isinstance(session, requests.Session)
+            assert MeteoForecast._get_shared_session() is session
+            mock_create.assert_called_once_with()
+
+    def test_create_session_retry_policy(self):
+        """Test that the session retries transient failures of both GET and POST requests."""
+        session = MeteoForecast._create_session()
+        adapter = session.get_adapter(MeteoForecast.base_url)
+
+        assert adapter.max_retries.total == MeteoForecast.max_retries
+        assert adapter.max_retries.backoff_factor == MeteoForecast.retry_backoff_factor
+        assert set(adapter.max_retries.status_forcelist) == {429, 500, 502, 503, 504}
+        assert adapter.max_retries.allowed_methods == {'GET', 'POST'}
+        assert not adapter.max_retries.raise_on_status
+
+    def test_create_session_retry_after_bound(self):
+        """Test that waits requested by Retry-After header are capped at retry_after_max."""
+        retry = MeteoForecast._create_session().get_adapter(MeteoForecast.base_url).max_retries
+
+        assert retry.get_retry_after(HTTPResponse(headers={'Retry-After': '3600'})) == MeteoForecast.retry_after_max
+        assert retry.get_retry_after(HTTPResponse(headers={'Retry-After': '2'})) == 2
+        assert retry.get_retry_after(HTTPResponse()) is None
+        # Retries made from the policy keep the bound
+        assert isinstance(retry.increment('GET', MeteoForecast.base_url), type(retry))
+
+    @pytest.mark.usefixtures('no_set_xy')
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context manager closes the HTTP session."""
+        with patch('requests.Session.close') as mock_close:
+            with MeteoForecast(self.api_key, self.latitude, self.longitude) as forecast:
+                assert isinstance(forecast, MeteoForecast)
+                mock_close.assert_not_called()
+
+            mock_close.assert_called_once_with()
+
     def test_connect_meteo_api_instance_method(self):
         """Test instance API connection method."""
         expected_result = {'data': 'test'}
         url = 'http://test.url'
 
-        with patch.object(MeteoForecast, '_set_xy'), \
-                patch.object(MeteoForecast, '_connect_meteo_api_') as mock_static:
+        with patch.object(MeteoForecast, '_connect_meteo_api_') as mock_static:
             mock_static.return_value = expected_result
-            forecast = MeteoForecast(self.api_key, self.latitude, self.longitude)
+            forecast = make_forecast(self.api_key, self.latitude, self.longitude)
 
             result = forecast._connect_meteo_api(url, post=True)
 
             assert result == expected_result
-            mock_static.assert_called_once_with(api_key=self.api_key, url=url, post=True)
+            mock_static.assert_called_once_with(api_key=self.api_key, url=url, post=True, session=forecast._session)
+
+    @patch.object(MeteoForecast, 'response_cache_ttl', 300)
+    @patch.object(MeteoForecast, '_connect_meteo_api_')
+    def test_connect_meteo_api_response_cache(self, mock_static):
+        """Test that GET responses are reused until they expire and POST responses are never cached."""
+        mock_static.side_effect = lambda **kwargs: {'url': kwargs['url']}
+        forecast = make_forecast(self.api_key, self.latitude, self.longitude)
+
+        with patch('meteo_forecast.meteo_forecast.monotonic', return_value=1000.0):
+            assert forecast._connect_meteo_api('http://test.url/a') == {'url': 'http://test.url/a'}
+            assert forecast._connect_meteo_api('http://test.url/a') == {'url': 'http://test.url/a'}
+            forecast._connect_meteo_api('http://test.url/a', post=True)
+            forecast._connect_meteo_api('http://test.url/a', post=True)
+        assert mock_static.call_count == 3
+
+        with patch('meteo_forecast.meteo_forecast.monotonic', return_value=1000.0 + MeteoForecast.response_cache_ttl):
+            forecast._connect_meteo_api('http://test.url/a')
+        assert mock_static.call_count == 4
+
+        forecast.clear_response_cache()
+        forecast._connect_meteo_api('http://test.url/a')
+        assert mock_static.call_count == 5
+
+        # Responses fetched with a replaced API key are not reused
+        forecast.api_key = 'other_key'
+        forecast._connect_meteo_api('http://test.url/a')
+        assert mock_static.call_count == 6
+        assert mock_static.call_args.kwargs['api_key'] == 'other_key'
+
+    @patch.object(MeteoForecast, 'response_cache_ttl', 300)
+    @patch.object(MeteoForecast, '_connect_meteo_api_')
+    def test_connect_meteo_api_response_cache_limits(self, mock_static):
+        """Test that response cache keeps only the most recently used entries and can be disabled."""
+        mock_static.side_effect = lambda **kwargs: {'url': kwargs['url']}
+        forecast = make_forecast(self.api_key, self.latitude, self.longitude)
+
+        with patch.object(MeteoForecast, 'response_cache_size', 2):
+            forecast._connect_meteo_api('http://test.url/a')
+            forecast._connect_meteo_api('http://test.url/b')
+            forecast._connect_meteo_api('http://test.url/a')
+            forecast._connect_meteo_api('http://test.url/c')
+            forecast._connect_meteo_api('http://test.url/a')
+            forecast._connect_meteo_api('http://test.url/c')
+            assert mock_static.call_count == 3
+            forecast._connect_meteo_api('http://test.url/b')
+        assert mock_static.call_count == 4
+
+        with patch.object(MeteoForecast, 'response_cache_ttl', 0):
+            forecast._connect_meteo_api('http://test.url/a')
+        assert mock_static.call_count == 5
 
     @patch.object(MeteoForecast, '_connect_meteo_api_')
     def test_get_xy_static(self, mock_connect):
@@ -114,7 +285,38 @@ class TestMeteoForecastUnit(BaseTest):
         assert x == x_expected
         assert y == y_expected
         expected_url = f'{MeteoForecast.base_url}{model}/grid/{grid}/latlon2rowcol/{lat}%2C{lon}/'
-        mock_connect.assert_called_once_with(api_key=api_key, url=expected_url)
+        mock_connect.assert_called_once_with(api_key=api_key, url=expected_url, session=None)
+
+    @patch.object(MeteoForecast, '_connect_meteo_api_')
+    def test_get_xy_static_quotes_model_and_grid(self, mock_connect):
+        """Test that get_xy percent-encodes model and grid names in URL."""
+        mock_connect.return_value = {'points': [{'col': 100, 'row': 200}]}
+
+        MeteoForecast.get_xy('test_key', 52.0, 21.0, 'w rf', 'd02/XLONG')
+
+        expected_url = f'{MeteoForecast.base_url}w%20rf/grid/d02%2FXLONG/latlon2rowcol/52.0%2C21.0/'
+        mock_connect.assert_called_once_with(api_key='test_key', url=expected_url, session=None)
+
+    @patch.object(MeteoForecast, '_connect_meteo_api_')
+    def test_get_xy_static_cache(self, mock_connect):
+        """Test that get_xy caches coordinates and evicts the least recently used ones."""
+        mock_connect.return_value = {'points': [{'col': 100, 'row': 200}]}
+
+        with patch.object(MeteoForecast, 'xy_cache_size', 2):
+            assert MeteoForecast.get_xy('test_key', 52.0, 21.0, 'wrf', 'd02_XLONG_XLAT') == (100, 200)
+            assert MeteoForecast.get_xy('test_key', 52.0, 21.0, 'wrf', 'd02_XLONG_XLAT') == (100, 200)
+            assert mock_connect.call_count == 1
+
+            MeteoForecast.get_xy('test_key', 53.0, 21.0, 'wrf', 'd02_XLONG_XLAT')
+            MeteoForecast.get_xy('test_key', 54.0, 21.0, 'wrf', 'd02_XLONG_XLAT')
+            assert mock_connect.call_count == 3
+
+            MeteoForecast.get_xy('test_key', 52.0, 21.0, 'wrf', 'd02_XLONG_XLAT')
+            assert mock_connect.call_count == 4
+
+            MeteoForecast.clear_xy_cache()
+            MeteoForecast.get_xy('test_key', 54.0, 21.0, 'wrf', 'd02_XLONG_XLAT')
+            assert mock_connect.call_count == 5
 
     def test_set_xy_instance_method(self):
         """Test instance _set_xy method."""
@@ -129,20 +331,69 @@ class TestMeteoForecastUnit(BaseTest):
 
             assert forecast.x == x
             assert forecast.y == y
-            mock_get_xy.assert_called_once_with(self.api_key, self.latitude, self.longitude, model=model, grid=grid)
+            mock_get_xy.assert_called_once_with(self.api_key, self.latitude, self.longitude, model=model, grid=grid,
+                                                session=forecast._session)
+
+    def test_get_forecast_async_cancel_does_not_wait(self):
+        """Test that cancelling get_forecast_async does not block the event loop until running requests finish."""
+        started = threading.Event()
+        release = threading.Event()
+        finished = threading.Event()
+
+        def blocking_fetch(*args, **kwargs):  # pylint: disable=unused-argument
+            started.set()
+            release.wait(5)
+            finished.set()
+            return {'times': [], 'data': []}
+
+        async def cancel_running():
+            task = asyncio.create_task(forecast.get_forecast_async())
+            while not started.is_set():
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert not finished.is_set()
+
+        forecast = make_forecast(self.api_key, self.latitude, self.longitude, T2_CONFIG)
+        with patch.object(MeteoForecast, '_fetch_field', side_effect=blocking_fetch):
+            try:
+                asyncio.run(cancel_running())
+            finally:
+                release.set()
+
+    def test_fetch_field_instance_method(self):
+        """Test instance _fetch_field method."""
+        url = f'{MeteoForecast.base_url}wrf/grid/d02_XLONG_XLAT/coordinates/200%2C100/field/'
+        expected_result = {'times': ['2024-01-01T06'], 'data': [20.5]}
+        dates = {'dates': [{'starting-date': '2024-01-01T00', 'interval': 6, 'count': 3}]}
+
+        with patch.object(MeteoForecast, '_connect_meteo_api') as mock_connect:
+            mock_connect.side_effect = [dates, expected_result]
+            forecast = make_forecast(self.api_key, self.latitude, self.longitude)
+
+            result = forecast._fetch_field(('T2', 0), url, datetime(2024, 1, 1, 6, tzinfo=timezone.utc))
+
+            assert result == expected_result
+            assert mock_connect.call_args_list == [
+                call(f'{url}T2/level/0/date/'),
+                call(f'{url}T2/level/0/date/2024-01-01T12/forecast/', True),
+            ]
 
-    def test_get_forecast_dates_static(self):
-        """Test static _get_forecast_dates method."""
-        date_dict = {
-            'starting-date': '2024-01-01T00',
-            'interval': 6,
-            'count': 3
-        }
-        expected = ['2024-01-01T00', '2024-01-01T06', '2024-01-01T12']
+    def test_fetch_field_quotes_field_name(self):
+        """Test that _fetch_field percent-encodes field names in URLs."""
+        url = f'{MeteoForecast.base_url}wrf/grid/d02_XLONG_XLAT/coordinates/200%2C100/field/'
 
-        result = MeteoForecast._get_forecast_dates(date_dict)
+        with patch.object(MeteoForecast, '_connect_meteo_api') as mock_connect:
+            mock_connect.side_effect = [
+                {'dates': [{'starting-date': '2024-01-01T00', 'interval': 6, 'count': 1}]},
+                {'times': [], 'data': []},
+            ]
+            forecast = make_forecast(self.api_key, self.latitude, self.longitude)
 
-        assert result == expected
+            forecast._fetch_field(('T 2/x', 0), url, datetime(2024, 1, 1, 0, tzinfo=timezone.utc))
+
+            mock_connect.assert_any_call(f'{url}T%202%2Fx/level/0/date/')
 
     @patch.object(MeteoForecast, '_connect_meteo_api_')
     def test_available_models_static(self, mock_connect):
@@ -154,7 +405,44 @@ class TestMeteoForecastUnit(BaseTest):
         result = MeteoForecast.available_models(api_key)
 
         assert result == models
-        mock_connect.assert_called_once_with(api_key, MeteoForecast.base_url)
+        mock_connect.assert_called_once_with(api_key, MeteoForecast.base_url, session=None)
+
+    @patch.object(MeteoForecast, '_connect_meteo_api_')
+    def test_available_models_static_cache(self, mock_connect):
+        """Test that available_* results are cached, evicted when expired and can be disabled."""
+        mock_connect.return_value = {'models': ['coamps', 'wrf']}
+
+        with patch('meteo_forecast.meteo_forecast.monotonic', return_value=1000.0):
+            result = MeteoForecast.available_models('test_key')
+            result.append('modified')
+            assert MeteoForecast.available_models('test_key') == ['coamps', 'wrf']
+            assert mock_connect.call_count == 1
+
+            MeteoForecast.available_models('other_key')
+            assert mock_connect.call_count == 2
+
+        with patch('meteo_forecast.meteo_forecast.monotonic', return_value=1000.0 + MeteoForecast.metadata_cache_ttl):
+            MeteoForecast.available_models('test_key')
+            assert mock_connect.call_count == 3
+
+        MeteoForecast.clear_metadata_cache()
+        with patch.object(MeteoForecast, 'metadata_cache_ttl', 0):
+            MeteoForecast.available_models('test_key')
+            MeteoForecast.available_models('test_key')
+        assert mock_connect.call_count == 5
+        assert MeteoForecast._metadata_cache.get(('test_key', MeteoForecast.base_url)) is None
+
+    @patch.object(MeteoForecast, 'metadata_cache_size', 1)
+    @patch.object(MeteoForecast, '_connect_meteo_api_')
+    def test_available_grids_static_cache_size(self, mock_connect):
+        """Test that the metadata cache keeps only the most recently used entries."""
+        mock_connect.return_value = {'grids': ['d01']}
+
+        MeteoForecast.available_grids('test_key', 'wrf')
+        MeteoForecast.available_grids('test_key', 'coamps')
+        MeteoForecast.available_grids('test_key', 'wrf')
+
+        assert mock_connect.call_count == 3
 
     @patch.object(MeteoForecast, '_connect_meteo_api_')
     def test_available_grids_static(self, mock_connect):
@@ -168,7 +456,7 @@ class TestMeteoForecastUnit(BaseTest):
 
         assert result == grids
         expected_url = f'{MeteoForecast.base_url}{model}/grid/'
-        mock_connect.assert_called_once_with(api_key, expected_url)
+        mock_connect.assert_called_once_with(api_key, expected_url, session=None)
 
     @patch.object(MeteoForecast, 'get_xy')
     @patch.object(MeteoForecast, '_connect_meteo_api_')
@@ -180,9 +468,9 @@ class TestMeteoForecastUnit(BaseTest):
         result = MeteoForecast.available_fields('test_key', 'wrf', 'd02_XLONG_XLAT', 52.0, 21.0)
 
         assert result == ['T2', 'RAINNC', 'U10']
-        mock_get_xy.assert_called_once_with('test_key', 52.0, 21.0, 'wrf', 'd02_XLONG_XLAT')
+        mock_get_xy.assert_called_once_with('test_key', 52.0, 21.0, 'wrf', 'd02_XLONG_XLAT', session=None)
         expected_url = f'{MeteoForecast.base_url}wrf/grid/d02_XLONG_XLAT/coordinates/200%2C100/field/'
-        mock_connect.assert_called_once_with('test_key', expected_url)
+        mock_connect.assert_called_once_with('test_key', expected_url, session=None)
 
     @patch.object(MeteoForecast, 'get_xy')
     @patch.object(MeteoForecast, '_connect_meteo_api_')
@@ -194,6 +482,6 @@ class TestMeteoForecastUnit(BaseTest):
         result = MeteoForecast.available_levels('test_key', 'wrf', 'd02_XLONG_XLAT', 'T2', 52.0, 21.0)
 
         assert result == [0, 850, 500]
-        mock_get_xy.assert_called_once_with('test_key', 52.0, 21.0, 'wrf', 'd02_XLONG_XLAT')
+        mock_get_xy.assert_called_once_with('test_key', 52.0, 21.0, 'wrf', 'd02_XLONG_XLAT', session=None)
         expected_url = f'{MeteoForecast.base_url}wrf/grid/d02_XLONG_XLAT/coordinates/200%2C100/field/T2/level/'
-        mock_connect.assert_called_once_with('test_key', expected_url)
+        mock_connect.assert_called_once_with('test_key', expected_url, session=None)